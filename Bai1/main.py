@@ -1,4 +1,6 @@
 from simpleai.search import SearchProblem, astar, greedy
+import os
+import sys
 import time
 
 class EightPuzzleProblem(SearchProblem):    
@@ -219,24 +221,73 @@ def solve_with_greedy():
 
     return result, end_time - start_time
 
+def print_bounded_stats(result):
+    print(f"Nodes expanded: {result.expanded}, generated: {result.generated}, "
+          f"forgotten: {result.forgotten}")
+    print(f"Peak nodes in memory: {result.peak_nodes}")
+
+def bounded_searches():
+    """{'sma': sma_star, 'beam': beam_search}, imported only when a bounded search runs"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.append(root)  # same helper as Bai2/main.py: bounded_search lives at the repo root
+    from bounded_search import beam_search, sma_star
+    return {'sma': sma_star, 'beam': beam_search}
+
+def solve_with_bounded(algorithm, **budget):
+    """Solve with a memory-bounded search ('sma' or 'beam') from bounded_search"""
+    name = {'sma': "SMA*", 'beam': "Beam search"}[algorithm]
+    search = bounded_searches()[algorithm]
+    print(f"\n### Solving 8-Puzzle with {name} (memory-bounded) ###")
+    problem = EightPuzzleProblem()
+    
+    print("Initial state:")
+    print_board(problem.initial_state, "Initial")
+    
+    print("Goal state:")
+    print_board(problem.goal_state, "Goal")
+    
+    limits = ", ".join(f"{key}={value}" for key, value in budget.items())
+    print(f"\nSolving with {name} ({limits})...")
+    result = search(problem, **budget)
+    
+    if result.solved:
+        print(f"{name} found solution!")
+    else:
+        print(f"{name} stopped ({result.stopped}) without a solution, "
+              f"best state found is {result.node.h} away (Manhattan distance)")
+    print(f"Time: {result.elapsed:.4f} seconds")
+    print(f"Path length: {len(result.node.path())} steps")
+    print(f"Total cost: {result.node.cost}")
+    print_bounded_stats(result)
+    print_solution_path(result.node, f"{name} Solution" if result.solved else f"{name} Best Path")
+    
+    return result.node if result.solved else None, result.elapsed
+
 def display_menu():
     print("\n" + "=" * 50)
     print("8-PUZZLE SOLVER")
     print("=" * 50)
     print("\n1. Solve with A* algorithm")
     print("2. Solve with Greedy algorithm")
+    print("3. Solve with SMA* (memory-bounded A*)")
+    print("4. Solve with Beam search (memory-bounded)")
     print("0. Exit")
     print("-" * 50)
 
 def main():
     while True:
         display_menu()
-        choice = input("\nEnter your choice (0-2): ").strip()
+        choice = input("\nEnter your choice (0-4): ").strip()
         
         if choice == '1':
             solve_with_astar()
         elif choice == '2':
             solve_with_greedy()
+        elif choice == '3':
+            solve_with_bounded('sma', max_nodes=1000)
+        elif choice == '4':
+            solve_with_bounded('beam', beam_width=100)
         elif choice == '0':
             print("\nThank you for using 8-Puzzle Solver!")
             break
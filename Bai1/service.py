@@ -0,0 +1,318 @@
+"""
+8-puzzle solver service.
+
+Reads one JSON request per line and writes one JSON response per line, either
+on stdin/stdout or on a local TCP socket:
+
+    python service.py                       # stdin/stdout
+    python service.py --port 8765           # 127.0.0.1:8765
+    python service.py --spill cache.db      # keep evicted solutions on disk
+
+Requests:
+    {"id": 1, "initial": [[2,8,3],[1,6,4],[7,0,5]], "goal": [[1,2,3],[8,0,4],[7,6,5]],
+     "algorithm": "astar"}
+    {"id": 2, "op": "metrics"}
+
+"goal" defaults to EightPuzzleProblem's goal and "algorithm" to astar (also
+greedy, sma, beam). Searches run in a process pool; identical requests that
+arrive while one is being solved share its result, and solved instances are
+kept in an LRU cache keyed on (initial, goal, algorithm).
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import multiprocessing
+import shelve
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from main import EightPuzzleProblem, bounded_searches
+
+ALGORITHMS = ('astar', 'greedy', 'sma', 'beam')
+DEFAULT_GOAL = EightPuzzleProblem().goal_state
+
+log = logging.getLogger(__name__)
+
+
+def solve_instance(initial, goal, algorithm):
+    """Solve one instance (runs in a worker process) and return a JSON-ready dict"""
+    problem = EightPuzzleProblem(initial, goal)
+    start = time.perf_counter()
+    if algorithm in ('astar', 'greedy'):
+        from simpleai.search import astar, greedy
+        search = astar if algorithm == 'astar' else greedy
+        node = search(problem, graph_search=True)
+    else:
+        result = bounded_searches()[algorithm](problem)
+        node = result.node if result.solved else None
+    solve_time = time.perf_counter() - start
+
+    if node is None:
+        return {'solved': False, 'solve_time': solve_time}
+    return {
+        'solved': True,
+        'cost': node.cost,
+        'actions': [action for action, _ in node.path()[1:]],
+        'solve_time': solve_time,
+    }
+
+
+def parse_state(value):
+    """JSON 3x3 list -> state tuple; raises ValueError if it is not a 3x3 board with tiles 0-8"""
+    try:
+        state = tuple(tuple(row) for row in value)
+    except TypeError:
+        raise ValueError("a state must be a 3x3 list of integers")
+    if (len(state) != 3 or any(len(row) != 3 for row in state)
+            or any(type(cell) is not int for row in state for cell in row)):  # no 5.5 -> 5, no true -> 1
+        raise ValueError("a state must be a 3x3 list of integers")
+    if sorted(cell for row in state for cell in row) != list(range(9)):
+        raise ValueError("a state must contain the tiles 0-8 exactly once")
+    return state
+
+
+def is_solvable(initial, goal):
+    """Both states must have the same inversion parity (the blank is ignored)"""
+    def parity(state):
+        tiles = [cell for row in state for cell in row if cell != 0]
+        inversions = sum(1 for i in range(8) for j in range(i + 1, 8) if tiles[i] > tiles[j])
+        return inversions % 2
+    return parity(initial) == parity(goal)
+
+
+class SolutionCache:
+    """
+    Size-bounded LRU of solved instances. If spill_path is set, entries
+    evicted from memory are written to a shelve file and found there again
+    on a later miss.
+    """
+
+    def __init__(self, maxsize=10000, spill_path=None):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.spill = shelve.open(spill_path) if spill_path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.spill is not None:
+            entry = self.spill.get(repr(key))
+            if entry is not None:
+                self.disk_hits += 1
+                self.put(key, entry)
+                return entry
+        self.misses += 1
+        return None
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            old_key, old_entry = self.entries.popitem(last=False)
+            if self.spill is not None:
+                self.spill[repr(old_key)] = old_entry
+
+    def close(self):
+        if self.spill is not None:
+            for key, entry in self.entries.items():
+                self.spill[repr(key)] = entry
+            self.spill.close()
+            self.spill = None
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SolverService:
+    """Answers requests from the cache, an in-flight search, or a new search in the pool"""
+
+    def __init__(self, workers=None, cache_size=10000, spill_path=None, latency_window=1000):
+        self.workers = workers
+        self.pool = self.new_pool()
+        self.cache = SolutionCache(cache_size, spill_path)
+        self.in_flight = {}
+        self.latencies = collections.deque(maxlen=latency_window)
+        self.requests = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def handle(self, request):
+        """One request dict -> one response dict (never raises for a bad request)"""
+        start = time.perf_counter()
+        response = {'id': request.get('id')}
+        try:
+            if request.get('op') == 'metrics':
+                response.update(self.metrics())
+                return response
+            self.requests += 1
+            response.update(await self.solve(request))
+        except ValueError as e:
+            self.errors += 1
+            response['error'] = str(e)
+        except Exception as e:
+            log.exception("request %r failed", response['id'])
+            self.errors += 1
+            response['error'] = f"solver failed: {e!r}"
+        self.latencies.append(time.perf_counter() - start)
+        response['latency'] = self.latencies[-1]
+        return response
+
+    def new_pool(self):
+        # workers forked while clients are connected would inherit their sockets
+        # (as in Bai4/server.py), so use forkserver where available
+        context = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(context))
+
+    async def solve(self, request):
+        if 'initial' not in request:
+            raise ValueError("missing 'initial'")
+        initial = parse_state(request['initial'])
+        goal = parse_state(request['goal']) if 'goal' in request else DEFAULT_GOAL
+        algorithm = request.get('algorithm', 'astar')
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {', '.join(ALGORITHMS)}")
+        if not is_solvable(initial, goal):
+            raise ValueError("the goal cannot be reached from this initial state")
+
+        key = (initial, goal, algorithm)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return dict(entry, source='cache')
+
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return dict(await asyncio.shield(future), source='coalesced')
+
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        future = loop.run_in_executor(pool, solve_instance, initial, goal, algorithm)
+        self.in_flight[key] = future
+        try:
+            entry = await future
+        except BrokenProcessPool:
+            if self.pool is pool:  # a dead worker breaks the whole pool; later requests get a fresh one
+                self.pool = self.new_pool()
+                pool.shutdown(wait=False)
+            raise
+        finally:
+            del self.in_flight[key]
+        self.cache.put(key, entry)
+        return dict(entry, source='solver')
+
+    def metrics(self):
+        lookups = self.cache.hits + self.cache.disk_hits + self.cache.misses
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(q / 100 * len(latencies)))]
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'queue_depth': len(self.in_flight),
+            'cache_size': len(self.cache),
+            'cache_hits': self.cache.hits,
+            'disk_hits': self.cache.disk_hits,
+            'coalesced': self.coalesced,
+            'hit_rate': (self.cache.hits + self.cache.disk_hits) / lookups if lookups else 0.0,
+            'latency_p50': percentile(50),
+            'latency_p95': percentile(95),
+            'latency_p99': percentile(99),
+        }
+
+    def close(self):
+        self.pool.shutdown()
+        self.cache.close()
+
+
+async def respond(service, line, write):
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("a request must be a JSON object")
+    except ValueError as e:
+        write({'error': f"invalid request: {e}"})
+        return
+    write(await service.handle(request))
+
+
+async def serve_stdio(service):
+    """Requests on stdin, responses on stdout in completion order (match them by id)"""
+    loop = asyncio.get_running_loop()
+    tasks = set()
+
+    def write(response):
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        if line.strip():
+            task = asyncio.create_task(respond(service, line, write))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def serve_socket(service, host, port):
+    async def client(reader, writer):
+        tasks = set()
+
+        def write(response):
+            writer.write((json.dumps(response) + "\n").encode())
+
+        while line := await reader.readline():
+            if line.strip():
+                task = asyncio.create_task(respond(service, line, write))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        writer.close()
+
+    server = await asyncio.start_server(client, host, port)
+    print(f"8-puzzle solver service listening on {host}:{port}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="8-puzzle solver service (JSON lines)")
+    parser.add_argument('--port', type=int, help="listen on a local TCP port instead of stdin/stdout")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--workers', type=int, help="solver processes (default: one per CPU)")
+    parser.add_argument('--cache-size', type=int, default=10000, help="solutions kept in memory")
+    parser.add_argument('--spill', metavar='PATH', help="shelve file for solutions evicted from memory")
+    args = parser.parse_args(argv)
+
+    service = SolverService(args.workers, args.cache_size, args.spill)
+    try:
+        if args.port is not None:
+            asyncio.run(serve_socket(service, args.host, args.port))
+        else:
+            asyncio.run(serve_stdio(service))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import service
+from service import SolverService, parse_state
+
+INITIAL = [[2, 8, 3], [1, 6, 4], [7, 0, 5]]
+
+
+@pytest.mark.parametrize('row, col, cell', [(2, 2, 5.5), (1, 0, True), (2, 2, "5")])
+def test_parse_state_rejects_non_integer_tiles(row, col, cell):
+    state = [list(r) for r in INITIAL]
+    state[row][col] = cell  # int(cell) would turn it back into the tile it replaced
+    with pytest.raises(ValueError):
+        parse_state(state)
+
+
+def _handle(error, monkeypatch):
+    def fail(*args):
+        raise error
+
+    monkeypatch.setattr(service, 'solve_instance', fail)
+    svc = SolverService(workers=1)
+    svc.pool.shutdown()
+    svc.pool = ThreadPoolExecutor(1)  # the patched solve_instance only exists in this process
+    try:
+        return svc, asyncio.run(svc.handle({'id': 7, 'initial': INITIAL}))
+    finally:
+        svc.close()
+
+
+def test_worker_failure_gets_an_error_reply(monkeypatch):
+    svc, response = _handle(RuntimeError("boom"), monkeypatch)
+    assert response['id'] == 7
+    assert 'boom' in response['error']
+    assert svc.errors == 1
+    assert not svc.in_flight
+
+
+def test_broken_pool_is_replaced(monkeypatch):
+    svc, response = _handle(BrokenProcessPool("worker died"), monkeypatch)
+    assert 'worker died' in response['error']
+    assert not isinstance(svc.pool, ThreadPoolExecutor)
@@ -0,0 +1,204 @@
+"""
+Exact cover with Knuth's Algorithm X on Dancing Links.
+
+The matrix is stored in flat lists (L, R, U, D, C indexed by node number)
+instead of node objects, and cover/uncover relink those lists in place, so
+backtracking allocates nothing. Secondary columns must be covered at most
+once instead of exactly once: they are left out of the header list, so they
+are never chosen, but selecting a row still removes every row that clashes
+with it there.
+
+Any placement puzzle can be described this way, for example:
+
+    >>> cover = ExactCover(primary=['a', 'b', 'c'])
+    >>> cover.add_row('x', ['a', 'b'])
+    >>> cover.add_row('y', ['c'])
+    >>> list(cover.solve())
+    [['x', 'y']]
+"""
+
+
+class ExactCover:
+    def __init__(self, primary, secondary=()):
+        self.columns = {}
+        self.rows = []       # name of each row
+        self.row_of = [-1]   # row index of each node (-1 for headers)
+        # node 0 is the root; nodes 1..len(columns) are the column headers
+        self.L, self.R, self.U, self.D, self.C, self.S = [0], [0], [0], [0], [0], [0]
+
+        for name in primary:
+            self._add_column(name, primary=True)
+        for name in secondary:
+            self._add_column(name, primary=False)
+
+    def _add_column(self, name, primary):
+        if name in self.columns:
+            raise ValueError(f"Duplicate column: {name!r}")
+        node = len(self.L)
+        self.columns[name] = node
+        self.row_of.append(-1)
+        self.U.append(node)
+        self.D.append(node)
+        self.C.append(node)
+        self.S.append(0)
+        if primary:
+            last = self.L[0]
+            self.L.append(last)
+            self.R.append(0)
+            self.R[last] = node
+            self.L[0] = node
+        else:
+            self.L.append(node)
+            self.R.append(node)
+
+    def add_row(self, name, columns):
+        """Add an option covering the given columns"""
+        if not columns:
+            raise ValueError("A row must cover at least one column")
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        row = len(self.rows)
+        self.rows.append(name)
+        first = len(L)
+        for k, column in enumerate(columns):
+            header = self.columns[column]
+            node = len(L)
+            # append at the bottom of the column
+            U.append(U[header])
+            D.append(header)
+            D[U[header]] = node
+            U[header] = node
+            C.append(header)
+            S[header] += 1
+            # link into the row, circularly
+            L.append(node - 1 if k else node)
+            R.append(first)
+            if k:
+                R[node - 1] = node
+                L[first] = node
+            self.row_of.append(row)
+
+    def solve(self, limit=None):
+        """
+        Yield every exact cover as a list of row names, as soon as it is found.
+        Columns are chosen smallest-first; the search is iterative, so the
+        recursion limit does not bound the number of rows in a solution.
+        """
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        rows, row_of = self.rows, self.row_of
+
+        def cover(c):
+            L[R[c]] = L[c]
+            R[L[c]] = R[c]
+            i = D[c]
+            while i != c:
+                j = R[i]
+                while j != i:
+                    U[D[j]] = U[j]
+                    D[U[j]] = D[j]
+                    S[C[j]] -= 1
+                    j = R[j]
+                i = D[i]
+
+        def uncover(c):
+            i = U[c]
+            while i != c:
+                j = L[i]
+                while j != i:
+                    S[C[j]] += 1
+                    U[D[j]] = j
+                    D[U[j]] = j
+                    j = L[j]
+                i = U[i]
+            L[R[c]] = c
+            R[L[c]] = c
+
+        found = 0
+        stack = []  # the row node chosen at each level
+        advance = True
+        try:
+            while True:
+                if advance:
+                    if R[0] == 0:
+                        yield [rows[row_of[node]] for node in stack]
+                        found += 1
+                        if limit is not None and found >= limit:
+                            return
+                        advance = False
+                        continue
+                    # choose the primary column with the fewest rows left
+                    c, best = R[0], S[R[0]]
+                    j = R[c]
+                    while j != 0 and best > 1:
+                        if S[j] < best:
+                            c, best = j, S[j]
+                        j = R[j]
+                    if best == 0:
+                        advance = False
+                        continue
+                    cover(c)
+                    r = D[c]
+                else:
+                    if not stack:
+                        return
+                    r = stack.pop()
+                    j = L[r]
+                    while j != r:
+                        uncover(C[j])
+                        j = L[j]
+                    c = C[r]
+                    r = D[r]
+
+                if r == c:
+                    uncover(c)
+                    advance = False
+                    continue
+                stack.append(r)
+                j = R[r]
+                while j != r:
+                    cover(C[j])
+                    j = R[j]
+                advance = True
+        finally:
+            # stopped early (limit reached or generator closed): restore the matrix
+            while stack:
+                r = stack.pop()
+                j = L[r]
+                while j != r:
+                    uncover(C[j])
+                    j = L[j]
+                uncover(C[r])
+
+    def count(self):
+        return sum(1 for _ in self.solve())
+
+
+def _organ_pipe(n):
+    """0..n-1 ordered from the middle outwards (middle rows constrain the most)"""
+    return sorted(range(n), key=lambda i: (abs(2 * i - (n - 1)), i))
+
+
+def queens_cover(n):
+    """
+    N-Queens as exact cover: every row and every column exactly once
+    (primary), every diagonal at most once (secondary). Row names are
+    (row, col) squares.
+    """
+    order = _organ_pipe(n)
+    primary = []
+    for i in order:
+        primary.extend((('row', i), ('col', i)))
+    secondary = [('diag', d) for d in range(2 * n - 1)] + [('anti', d) for d in range(2 * n - 1)]
+    cover = ExactCover(primary, secondary)
+    for r in order:
+        for c in order:
+            cover.add_row((r, c), [('row', r), ('col', c), ('diag', r + c), ('anti', r - c + n - 1)])
+    return cover
+
+
+def queens_solutions(n, limit=None):
+    """Yield N-Queens solutions as state tuples (state[row] = col), like EightQueensProblem"""
+    for squares in queens_cover(n).solve(limit):
+        state = [0] * n
+        for r, c in squares:
+            state[r] = c
+        yield tuple(state)
@@ -1,12 +1,14 @@
 from simpleai.search import SearchProblem, astar, greedy, breadth_first, depth_first
+import os
+import sys
 import time
 
 class EightQueensProblem(SearchProblem):
-    def __init__(self, initial_state=None):
+    def __init__(self, initial_state=None, size=8):
         if initial_state is None:
             initial_state = tuple()
         super().__init__(initial_state)
-        self.size = 8
+        self.size = size
     
     def actions(self, state):
         if len(state) == self.size:
@@ -60,6 +62,11 @@ class EightQueensProblem(SearchProblem):
         
         return remaining_queens + conflicts + (self.size - available_cols)
     
+    def progress(self, state):
+        # The heuristic stays >= size until the goal, so a bounded search ranks
+        # its best partial answer by the number of queens placed instead
+        return len(state)
+    
     def cost(self, state1, action, state2):
         return 1
 
@@ -204,6 +211,71 @@ def compare_first_solutions():
     else:
         print(f"\nGreedy was faster by {astar_time - greedy_time:.4f} seconds")
 
+def bounded_searches():
+    """{'sma': sma_star, 'beam': beam_search}, imported only when a bounded search runs"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.append(root)  # same helper as Bai1/main.py: bounded_search lives at the repo root
+    from bounded_search import beam_search, sma_star
+    return {'sma': sma_star, 'beam': beam_search}
+
+def solve_first_with_bounded(algorithm, **budget):
+    """First solution with a memory-bounded search ('sma' or 'beam'), for any board size"""
+    name = {'sma': "SMA*", 'beam': "Beam search"}[algorithm]
+    search = bounded_searches()[algorithm]
+    size_str = input("Board size N (default=8): ").strip()
+    size = int(size_str) if size_str.isdigit() and int(size_str) >= 4 else 8
+    print(f"\n### Finding FIRST Solution with {name} on {size}x{size} (memory-bounded) ###")
+    problem = EightQueensProblem(size=size)
+    
+    result = search(problem, **budget)
+    
+    limits = ", ".join(f"{key}={value}" for key, value in budget.items())
+    print(f"\nSearch stopped ({result.stopped}) in {result.elapsed:.4f} seconds with {limits}")
+    print(f"Nodes expanded: {result.expanded}, generated: {result.generated}, "
+          f"forgotten: {result.forgotten}")
+    print(f"Peak nodes in memory: {result.peak_nodes}")
+    if result.solved:
+        print(f"Path length: {len(result.node.path())}")
+        print(f"Solution state: {result.node.state}")
+        print_board(result.node, f"{name} Solution")
+    else:
+        print(f"No solution within the budget, best partial placement: {result.node.state}")
+    
+    return result.node if result.solved else None, result.elapsed
+
+def find_all_with_dancing_links():
+    """Stream all N-Queens solutions from the Dancing Links exact-cover engine"""
+    from dlx import queens_solutions
+    
+    size_str = input("Board size N (default=8): ").strip()
+    size = int(size_str) if size_str.isdigit() and int(size_str) >= 1 else 8
+    print(f"\n### Finding ALL {size} Queens Solutions with Dancing Links ###")
+    print("Rows and columns are exact-cover constraints, diagonals at-most-once constraints")
+    
+    all_solutions = []
+    start_time = time.time()
+    for solution in queens_solutions(size):
+        all_solutions.append(solution)
+        if len(all_solutions) <= 3:
+            print(f"Solution #{len(all_solutions)} after {time.time() - start_time:.4f} seconds: {solution}")
+    end_time = time.time()
+    
+    print(f"\nFound {len(all_solutions)} unique solutions in {end_time - start_time:.4f} seconds")
+    
+    show_all = input("\nShow all solutions? (y/n, default=n): ").strip().lower() == 'y'
+    
+    if show_all:
+        for i, solution in enumerate(all_solutions, 1):
+            print_board(solution, f"Solution #{i}")
+    else:
+        if all_solutions:
+            print("\nShowing first 3 solutions as examples:")
+            for i in range(min(3, len(all_solutions))):
+                print_board(all_solutions[i], f"Solution #{i+1}")
+    
+    return all_solutions
+
 def find_all_with_algorithm(algorithm_name):
     print(f"\n### Finding ALL Solutions with Modified {algorithm_name} ###")
     print("Note: Traditional A*/Greedy return first solution only.")
@@ -296,13 +368,16 @@ def display_menu():
     print("4. Find ALL 92 solutions (standard DFS)")
     print("5. Find ALL solutions with A* guided search")
     print("6. Find ALL solutions with Greedy approach")
+    print("7. Find FIRST solution with SMA* (memory-bounded, any N)")
+    print("8. Find FIRST solution with Beam search (memory-bounded, any N)")
+    print("9. Find ALL solutions with Dancing Links (any N)")
     print("0. Exit")
     print("-" * 60)
 
 def main():
     while True:
         display_menu()
-        choice = input("\nEnter your choice (0-6): ").strip()
+        choice = input("\nEnter your choice (0-9): ").strip()
         
         if choice == '1':
             solve_first_with_astar()
@@ -316,11 +391,17 @@ def main():
             find_all_with_algorithm("A*")
         elif choice == '6':
             find_all_with_algorithm("Greedy")
+        elif choice == '7':
+            solve_first_with_bounded('sma', max_nodes=5000)
+        elif choice == '8':
+            solve_first_with_bounded('beam', beam_width=100)
+        elif choice == '9':
+            find_all_with_dancing_links()
         elif choice == '0':
             print("\nThank you for using 8 Queens Solver!")
             break
         else:
-            print("\nInvalid choice! Please enter a number between 0-6.")
+            print("\nInvalid choice! Please enter a number between 0-9.")
         
         input("\nPress Enter to continue...")
 
@@ -0,0 +1,23 @@
+from bounded_search import beam_search, sma_star
+
+from main import EightQueensProblem
+
+
+def _placement_is_safe(state):
+    return all(state[i] != state[j] and abs(state[i] - state[j]) != j - i
+               for i in range(len(state)) for j in range(i + 1, len(state)))
+
+
+def test_small_budgets_return_a_partial_placement():
+    results = [sma_star(EightQueensProblem(size=8), max_nodes=10, max_expansions=2000),
+               sma_star(EightQueensProblem(size=20), max_nodes=10, max_expansions=2000),
+               beam_search(EightQueensProblem(size=12), beam_width=2)]
+    for result in results:
+        assert not result.solved
+        assert len(result.node.state) >= 2
+        assert _placement_is_safe(result.node.state)
+
+
+def test_budget_large_enough_still_solves():
+    result = sma_star(EightQueensProblem(size=8), max_nodes=5000)
+    assert result.solved and len(result.node.state) == 8
@@ -0,0 +1,197 @@
+import math
+import random
+import time
+from collections import namedtuple
+
+
+AnnealingResult = namedtuple('AnnealingResult', 'state conflicts iterations')
+
+
+class ExponentialSchedule:
+    """T = k * exp(-lam * iteration), giống lịch mặc định của simpleai."""
+
+    def __init__(self, k=20, lam=0.005, t_min=1e-4):
+        self.k = k
+        self.lam = lam
+        self.t_min = t_min
+
+    def start(self):
+        return self.k
+
+    def step(self, iteration, delta, accepted, improved):
+        return max(self.k * math.exp(-self.lam * iteration), self.t_min)
+
+
+class ReheatingSchedule(ExponentialSchedule):
+    """Lịch mũ, nhưng hâm nóng lại khi best không cải thiện sau `patience` bước."""
+
+    def __init__(self, k=20, lam=0.005, t_min=1e-4, patience=1000, reheat=0.1):
+        super().__init__(k, lam, t_min)
+        self.patience = patience
+        self.reheat = reheat
+
+    def start(self):
+        self._origin = 0
+        self._stale = 0
+        return self.k
+
+    def step(self, iteration, delta, accepted, improved):
+        self._stale = 0 if improved else self._stale + 1
+        if self._stale >= self.patience:
+            # Quay lại thời điểm mà nhiệt độ bằng reheat * k
+            self._origin = iteration + math.log(self.reheat) / self.lam
+            self._stale = 0
+        return max(self.k * math.exp(-self.lam * (iteration - self._origin)), self.t_min)
+
+
+class AcceptanceRateSchedule:
+    """Điều chỉnh T để tỷ lệ chấp nhận nước đi xấu hơn bám theo `target`.
+
+    Tỷ lệ tính trên `window` nước xấu hơn (delta > 0) gần nhất được đề xuất.
+    """
+
+    def __init__(self, t0=2.0, target=0.02, window=100, factor=1.1, t_min=1e-4):
+        self.t0 = t0
+        self.target = target
+        self.window = window
+        self.factor = factor
+        self.t_min = t_min
+
+    def start(self):
+        self._t = self.t0
+        self._accepted = 0
+        self._seen = 0
+        return self._t
+
+    def step(self, iteration, delta, accepted, improved):
+        if delta <= 0:
+            return self._t  # nước không xấu hơn luôn được nhận, không tính vào tỷ lệ
+        self._seen += 1
+        self._accepted += accepted
+        if self._seen >= self.window:
+            if self._accepted / self._seen > self.target:
+                self._t = max(self._t / self.factor, self.t_min)
+            else:
+                self._t *= self.factor
+            self._accepted = 0
+            self._seen = 0
+        return self._t
+
+
+SCHEDULES = {
+    'exponential': ExponentialSchedule,
+    'reheating': ReheatingSchedule,
+    'acceptance': AcceptanceRateSchedule,
+}
+
+
+def anneal(n=8, initial_state=None, schedule=None, iterations_limit=10000, rng=random):
+    """Simulated annealing cho N quân hậu.
+
+    Mỗi bước chọn ngẫu nhiên một nước (row, col) trong O(1) và tính độ thay
+    đổi số conflicts trong O(1) nhờ số quân hậu trên từng cột và đường chéo.
+    """
+    if initial_state is None:
+        initial_state = tuple(rng.randrange(n) for _ in range(n))
+    if schedule is None:
+        schedule = ExponentialSchedule()
+    state = list(initial_state)
+    n = len(state)
+
+    cols = [0] * n
+    diag1 = [0] * (2 * n - 1)  # row + col
+    diag2 = [0] * (2 * n - 1)  # row - col + n - 1
+    for row, col in enumerate(state):
+        cols[col] += 1
+        diag1[row + col] += 1
+        diag2[row - col + n - 1] += 1
+    conflicts = sum(c * (c - 1) // 2 for lines in (cols, diag1, diag2) for c in lines)
+
+    best_state = tuple(state)
+    best_conflicts = conflicts
+    randrange = rng.randrange
+    uniform = rng.random
+    exp = math.exp
+    temperature = schedule.start()
+    step = schedule.step
+
+    iteration = 0
+    while iteration < iterations_limit and best_conflicts > 0:
+        row = randrange(n)
+        old = state[row]
+        new = randrange(n - 1)
+        if new >= old:
+            new += 1
+
+        d1_old, d2_old = row + old, row - old + n - 1
+        d1_new, d2_new = row + new, row - new + n - 1
+        delta = (cols[new] + diag1[d1_new] + diag2[d2_new]
+                 - cols[old] - diag1[d1_old] - diag2[d2_old] + 3)
+
+        accepted = delta <= 0 or uniform() < exp(-delta / temperature)
+        improved = False
+        if accepted:
+            cols[old] -= 1
+            diag1[d1_old] -= 1
+            diag2[d2_old] -= 1
+            cols[new] += 1
+            diag1[d1_new] += 1
+            diag2[d2_new] += 1
+            state[row] = new
+            conflicts += delta
+            if conflicts < best_conflicts:
+                best_conflicts = conflicts
+                best_state = tuple(state)
+                improved = True
+
+        iteration += 1
+        temperature = step(iteration, delta, accepted, improved)
+
+    return AnnealingResult(best_state, best_conflicts, iteration)
+
+
+def measure_throughput(n, iterations, schedule='exponential', seed=0):
+    """Số vòng lặp/giây của anneal() với N cho trước (dừng sớm nếu tìm được nghiệm)."""
+    rng = random.Random(seed)
+    initial_state = tuple(rng.randrange(n) for _ in range(n))
+    start = time.perf_counter()
+    result = anneal(n, initial_state, SCHEDULES[schedule](), iterations, rng)
+    elapsed = time.perf_counter() - start
+    return result.iterations / elapsed if elapsed else 0.0, result
+
+
+def measure_simpleai_throughput(iterations, seed=0):
+    """Số vòng lặp/giây của simulated_annealing của simpleai (chỉ N=8)."""
+    from simpleai.search import simulated_annealing
+    from main import EightQueensProblem
+
+    random.seed(seed)
+    problem = EightQueensProblem()
+    start = time.perf_counter()
+    simulated_annealing(problem, iterations_limit=iterations)
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed else 0.0
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulated annealing N quân hậu")
+    parser.add_argument('--n', type=int, action='append',
+                        help="kích thước bàn cờ (mặc định: 8 và 1000)")
+    parser.add_argument('--iterations', type=int, default=100000)
+    parser.add_argument('--schedule', choices=sorted(SCHEDULES), default='exponential')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for n in args.n or [8, 1000]:
+        rate, result = measure_throughput(n, args.iterations, args.schedule, args.seed)
+        print(f"N={n}: {rate:,.0f} vòng lặp/giây, {result.iterations} vòng lặp, "
+              f"conflicts còn lại: {result.conflicts}")
+        if n == 8:
+            baseline = measure_simpleai_throughput(min(args.iterations, 10000), args.seed)
+            print(f"N=8 (simpleai): {baseline:,.0f} vòng lặp/giây")
+
+
+if __name__ == "__main__":
+    main()
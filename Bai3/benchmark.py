@@ -0,0 +1,195 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)  # benchmarks/ nằm ở thư mục gốc repo
+from benchmarks.harness import percentile
+from main import (ENCODINGS, FREE_ENCODING_ONLY, FitnessCache, run_annealing_engine, run_genetic,
+                  run_hill_climbing, run_simulated_annealing, run_steady_state)
+
+
+def _run_hill_climbing(problem, encoding):
+    return run_hill_climbing(problem)
+
+
+def _run_simulated_annealing(problem, encoding):
+    return run_simulated_annealing(problem, iterations_limit=10000)
+
+
+def _run_annealing(problem, encoding):
+    return run_annealing_engine(problem.initial_state, iterations_limit=10000)
+
+
+def _run_genetic(problem, encoding):
+    population = [encoding['random_state']() for _ in range(100)]
+    return run_genetic(problem, population, crossover=encoding['crossover'],
+                       mutate=encoding['mutate'])
+
+
+def _run_steady_state(problem, encoding):
+    population = [encoding['random_state']() for _ in range(100)]
+    return run_steady_state(population)
+
+
+SOLVERS = {
+    'hill_climbing': _run_hill_climbing,
+    'simulated_annealing': _run_simulated_annealing,
+    'genetic': _run_genetic,
+    'annealing': _run_annealing,
+    'steady_state': _run_steady_state,
+}
+
+
+def run_trial(solver, seed, cache_size=0, encoding='free'):
+    """Chạy một lần solver với seed cố định, không in gì, đo bằng perf_counter."""
+    random.seed(seed)
+    spec = ENCODINGS[encoding]
+    cache = FitnessCache(cache_size) if cache_size else None
+    problem = spec['problem'](cache=cache)
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        result = solver(problem, spec)
+        elapsed = time.perf_counter() - start
+    trial = {
+        'seed': seed,
+        'success': result.conflicts == 0,
+        'time': elapsed,
+        'evaluations': result.evaluations,
+    }
+    if cache is not None:
+        trial['cache_hit_rate'] = cache.stats()['hit_rate']
+    return trial
+
+
+def bootstrap_ci(values, statistic, resamples=1000, confidence=0.95, seed=0):
+    """Khoảng tin cậy bootstrap (percentile) cho statistic(values)."""
+    if not values:
+        return None
+    rng = random.Random(seed)
+    n = len(values)
+    estimates = sorted(statistic([values[rng.randrange(n)] for _ in range(n)])
+                       for _ in range(resamples))
+    alpha = (1 - confidence) / 2 * 100
+    return [percentile(estimates, alpha), percentile(estimates, 100 - alpha)]
+
+
+def wilson_ci(successes, trials, z=1.96):
+    """Khoảng tin cậy Wilson cho tỷ lệ thành công."""
+    if trials == 0:
+        return None
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return [centre - margin, centre + margin]
+
+
+def _throughput(trials):
+    total_time = sum(t['time'] for t in trials)
+    return sum(t['evaluations'] for t in trials) / total_time if total_time else 0.0
+
+
+def summarize(name, trials, resamples=1000):
+    solved = [t['time'] for t in trials if t['success']]
+    successes = len(solved)
+    report = {
+        'solver': name,
+        'trials': len(trials),
+        'success_rate': successes / len(trials),
+        'success_rate_ci': wilson_ci(successes, len(trials)),
+        'median_time': statistics.median(solved) if solved else None,
+        'median_time_ci': bootstrap_ci(solved, statistics.median, resamples),
+        'p95_time': percentile(solved, 95),
+        'p95_time_ci': bootstrap_ci(solved, lambda xs: percentile(xs, 95), resamples),
+        'median_evaluations': statistics.median(t['evaluations'] for t in trials),
+        'evaluations_per_second': _throughput(trials),
+        'evaluations_per_second_ci': bootstrap_ci(trials, _throughput, resamples),
+    }
+    if 'cache_hit_rate' in trials[0]:
+        report['cache_hit_rate'] = statistics.mean(t['cache_hit_rate'] for t in trials)
+    return report
+
+
+def benchmark(solvers=None, trials=200, base_seed=0, resamples=1000, cache_size=0,
+              encoding='free'):
+    """Chạy mỗi solver `trials` lần với seed base_seed, base_seed+1, ...
+
+    Khi encoding khác 'free', mặc định bỏ qua các solver chỉ hỗ trợ mã hóa tự
+    do; chỉ định chúng tường minh thì báo ValueError.
+    """
+    if solvers is None:
+        solvers = [name for name in SOLVERS if encoding == 'free' or name not in FREE_ENCODING_ONLY]
+    unsupported = [name for name in solvers if encoding != 'free' and name in FREE_ENCODING_ONLY]
+    if unsupported:
+        raise ValueError(f"{', '.join(unsupported)} chỉ hỗ trợ mã hóa 'free', không phải '{encoding}'")
+    reports = []
+    for name in solvers:
+        runs = [run_trial(SOLVERS[name], base_seed + i, cache_size, encoding)
+                for i in range(trials)]
+        reports.append(summarize(name, runs, resamples))
+    return reports
+
+
+def print_table(reports, stream=sys.stderr):
+    def fmt(value, scale=1.0, digits=4):
+        return 'N/A' if value is None else f"{value * scale:.{digits}f}"
+
+    print(f"{'Thuật toán':<20} {'Thành công':<12} {'Median (ms)':<12} "
+          f"{'p95 (ms)':<12} {'Eval/s':<12}", file=stream)
+    print("-" * 70, file=stream)
+    for r in reports:
+        print(f"{r['solver']:<20} {r['success_rate'] * 100:<12.1f} "
+              f"{fmt(r['median_time'], 1000, 3):<12} {fmt(r['p95_time'], 1000, 3):<12} "
+              f"{r['evaluations_per_second']:<12.0f}", file=stream)
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"cần số nguyên >= 1, nhận {value}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark các thuật toán 8 quân hậu")
+    parser.add_argument('--solver', action='append', choices=sorted(SOLVERS),
+                        help="solver cần đo (mặc định: tất cả)")
+    parser.add_argument('--trials', type=_positive_int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--resamples', type=int, default=1000)
+    parser.add_argument('--cache-size', type=int, default=0,
+                        help="bật FitnessCache với kích thước này (0 = tắt)")
+    parser.add_argument('--encoding', choices=sorted(ENCODINGS), default='free',
+                        help="biểu diễn state cho các solver")
+    parser.add_argument('--output', help="ghi JSON ra file thay vì stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        reports = benchmark(args.solver, args.trials, args.seed, args.resamples, args.cache_size,
+                            args.encoding)
+    except ValueError as e:
+        parser.error(str(e))
+    print_table(reports)
+
+    payload = json.dumps({'trials': args.trials, 'seed': args.seed, 'cache_size': args.cache_size,
+                          'encoding': args.encoding,
+                          'results': reports}, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import argparse
+import json
+import sys
+
+from main import ALGORITHMS, ENCODINGS, solve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Giải N quân hậu không tương tác, mỗi lần chạy in một dòng JSON")
+    parser.add_argument('--n', type=int, default=8)
+    parser.add_argument('--algorithm', choices=ALGORITHMS, default='annealing')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budget', type=int,
+                        help="số vòng lặp (số thế hệ với GA), mặc định theo thuật toán")
+    parser.add_argument('--encoding', choices=sorted(ENCODINGS), default='free')
+    parser.add_argument('--runs', type=int, default=1,
+                        help="số lần chạy, seed tăng dần từ --seed")
+    args = parser.parse_args(argv)
+
+    for i in range(args.runs):
+        seed = args.seed + i
+        try:
+            result = solve(args.algorithm, args.n, seed, args.budget, args.encoding)
+        except ValueError as e:
+            parser.error(str(e))
+        record = {
+            'algorithm': args.algorithm,
+            'n': args.n,
+            'seed': seed,
+            'budget': args.budget,
+            'encoding': args.encoding,
+            'success': result.conflicts == 0,
+        }
+        record.update(result._asdict())
+        record['state'] = list(record['state'])
+        sys.stdout.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,84 @@
+import functools
 import random
 import time
+from collections import namedtuple
 from simpleai.search import SearchProblem, hill_climbing, genetic, simulated_annealing
 
+from annealing import anneal
+from steady_state import steady_state_ga
+
+SolveResult = namedtuple('SolveResult', 'state conflicts evaluations iterations elapsed')
+
+def count_conflicts(state):
+    n = len(state)
+    conflicts = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if state[i] == state[j]:
+                conflicts += 1
+            elif abs(state[i] - state[j]) == abs(i - j):
+                conflicts += 1
+    return conflicts
+
+def count_diagonal_conflicts(state):
+    """Số cặp hậu cùng đường chéo; đủ cho state dạng hoán vị (không trùng cột)."""
+    n = len(state)
+    diag1 = [0] * (2 * n - 1)
+    diag2 = [0] * (2 * n - 1)
+    for row, col in enumerate(state):
+        diag1[row + col] += 1
+        diag2[row - col + n - 1] += 1
+    return sum(c * (c - 1) // 2 for c in diag1) + sum(c * (c - 1) // 2 for c in diag2)
+
+class FitnessCache:
+    """LRU có giới hạn cho số conflicts, khóa là tuple state.
+
+    Một cache có thể dùng chung cho nhiều EightQueensProblem (GA, SA, ...).
+    Mỗi hàm đếm (count_conflicts, count_diagonal_conflicts) có một
+    lru_cache riêng, tối đa maxsize mục, nên PermutationQueensProblem vẫn
+    dùng hàm đếm nhanh chỉ trên đường chéo của nó.
+    """
+    
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._caches = {}
+    
+    def lookup(self, state, count=count_conflicts):
+        cached = self._caches.get(count)
+        if cached is None:
+            cached = self._caches[count] = functools.lru_cache(maxsize=self.maxsize)(count)
+        return cached(state)
+    
+    def stats(self):
+        infos = [cached.cache_info() for cached in self._caches.values()]
+        hits = sum(info.hits for info in infos)
+        misses = sum(info.misses for info in infos)
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': sum(info.currsize for info in infos),
+            'maxsize': self.maxsize,
+            'hit_rate': hits / total if total else 0.0,
+        }
+    
+    def report(self):
+        stats = self.stats()
+        return (f"Cache: {stats['hits']} hits / {stats['misses']} misses, "
+                f"tiết kiệm {stats['hit_rate'] * 100:.1f}% số lần tính conflicts")
+    
+    def clear(self):
+        for cached in self._caches.values():
+            cached.cache_clear()
+
 class EightQueensProblem(SearchProblem):
+    count = staticmethod(count_conflicts)
     
-    def __init__(self, initial_state=None):
+    def __init__(self, initial_state=None, cache=None):
         if initial_state is None:
             initial_state = tuple(random.randint(0, 7) for _ in range(8))
+        self.cache = cache
+        self.evaluations = 0
         super().__init__(initial_state)
     
     def actions(self, state):
@@ -24,24 +96,45 @@ class EightQueensProblem(SearchProblem):
         return tuple(new_state)
     
     def value(self, state):
+        self.evaluations += 1
         return 28 - self._conflicts(state)
     
     def _conflicts(self, state):
-        conflicts = 0
-        for i in range(8):
-            for j in range(i + 1, 8):
-                if state[i] == state[j]:
-                    conflicts += 1
-                elif abs(state[i] - state[j]) == abs(i - j):
-                    conflicts += 1
-        return conflicts
+        if self.cache is not None:
+            return self.cache.lookup(state, self.count)
+        return self.count(state)
     
     def is_goal(self, state):
         return self._conflicts(state) == 0
 
+class PermutationQueensProblem(EightQueensProblem):
+    """State là một hoán vị của 0..7: không bao giờ có hai hậu cùng cột.
+
+    Láng giềng là các phép đổi chỗ hai hàng (28 nước thay vì 56), và chỉ cần
+    đếm conflicts trên đường chéo.
+    """
+    count = staticmethod(count_diagonal_conflicts)
+    
+    def __init__(self, initial_state=None, cache=None):
+        if initial_state is None:
+            initial_state = generate_random_permutation()
+        super().__init__(initial_state, cache)
+    
+    def actions(self, state):
+        return [(i, j) for i in range(8) for j in range(i + 1, 8)]
+    
+    def result(self, state, action):
+        i, j = action
+        new_state = list(state)
+        new_state[i], new_state[j] = new_state[j], new_state[i]
+        return tuple(new_state)
+
 def generate_random_state():
     return tuple(random.randint(0, 7) for _ in range(8))
 
+def generate_random_permutation():
+    return tuple(random.sample(range(8), 8))
+
 def crossover(state1, state2):
     crossover_point = random.randint(1, 6)
     child1 = state1[:crossover_point] + state2[crossover_point:]
@@ -55,6 +148,198 @@ def mutate(state):
     state_list[row] = new_col
     return tuple(state_list)
 
+def swap_mutate(state):
+    state_list = list(state)
+    i, j = random.sample(range(8), 2)
+    state_list[i], state_list[j] = state_list[j], state_list[i]
+    return tuple(state_list)
+
+def _order_child(keep, other, start, end):
+    child = [None] * 8
+    child[start:end] = keep[start:end]
+    used = set(keep[start:end])
+    fill = [gene for gene in other[end:] + other[:end] if gene not in used]
+    for offset, gene in enumerate(fill):
+        child[(end + offset) % 8] = gene
+    return tuple(child)
+
+def order_crossover(state1, state2):
+    """Order crossover (OX): giữ một đoạn của cha, phần còn lại theo thứ tự của mẹ."""
+    start, end = sorted(random.sample(range(9), 2))
+    return (_order_child(state1, state2, start, end),
+            _order_child(state2, state1, start, end))
+
+def _pmx_child(keep, other, start, end):
+    child = list(other)
+    child[start:end] = keep[start:end]
+    segment = keep[start:end]
+    mapping = dict(zip(keep[start:end], other[start:end]))
+    for i in list(range(start)) + list(range(end, 8)):
+        gene = other[i]
+        while gene in segment:
+            gene = mapping[gene]
+        child[i] = gene
+    return tuple(child)
+
+def pmx_crossover(state1, state2):
+    """Partially mapped crossover (PMX) cho state dạng hoán vị."""
+    start, end = sorted(random.sample(range(9), 2))
+    return (_pmx_child(state1, state2, start, end),
+            _pmx_child(state2, state1, start, end))
+
+ENCODINGS = {
+    'free': {
+        'problem': EightQueensProblem,
+        'random_state': generate_random_state,
+        'crossover': crossover,
+        'mutate': mutate,
+    },
+    'permutation': {
+        'problem': PermutationQueensProblem,
+        'random_state': generate_random_permutation,
+        'crossover': order_crossover,
+        'mutate': swap_mutate,
+    },
+    'permutation-pmx': {
+        'problem': PermutationQueensProblem,
+        'random_state': generate_random_permutation,
+        'crossover': pmx_crossover,
+        'mutate': swap_mutate,
+    },
+}
+
+def run_genetic(problem, population, mutation_rate=0.1, generations=1000,
+                crossover=crossover, mutate=mutate, on_generation=None):
+    """Chạy GA không in gì ra màn hình; state của kết quả là cá thể tốt nhất.
+
+    on_generation(thế hệ), nếu có, được gọi sau mỗi thế hệ (dùng để đo đạc).
+    """
+    evaluations = problem.evaluations
+    start = time.perf_counter()
+    population_size = len(population)
+    best_solution = None
+    best_fitness = -1
+    
+    for generation in range(1, generations + 1):
+        fitness_scores = [problem.value(individual) for individual in population]
+        
+        max_fitness = max(fitness_scores)
+        if max_fitness > best_fitness:
+            best_fitness = max_fitness
+            best_index = fitness_scores.index(max_fitness)
+            best_solution = population[best_index]
+            
+            if max_fitness == 28:
+                break
+        
+        new_population = []
+        
+        for _ in range(population_size // 2):
+            parent1 = tournament_selection(population, fitness_scores)
+            parent2 = tournament_selection(population, fitness_scores)
+            
+            child1, child2 = crossover(parent1, parent2)
+            
+            if random.random() < mutation_rate:
+                child1 = mutate(child1)
+            if random.random() < mutation_rate:
+                child2 = mutate(child2)
+            
+            new_population.extend([child1, child2])
+        
+        population = new_population
+        if on_generation is not None:
+            on_generation(generation)
+    
+    elapsed = time.perf_counter() - start
+    return SolveResult(best_solution, problem._conflicts(best_solution),
+                       problem.evaluations - evaluations, generation, elapsed)
+
+def run_hill_climbing(problem, iterations_limit=0):
+    """Hill climbing của simpleai không in gì; iterations là số bước leo."""
+    evaluations = problem.evaluations
+    start = time.perf_counter()
+    node = hill_climbing(problem, iterations_limit=iterations_limit)
+    elapsed = time.perf_counter() - start
+    return SolveResult(node.state, problem._conflicts(node.state),
+                       problem.evaluations - evaluations, node.depth, elapsed)
+
+def run_simulated_annealing(problem, iterations_limit=10000):
+    """Simulated annealing của simpleai không in gì."""
+    evaluations = problem.evaluations
+    start = time.perf_counter()
+    node = simulated_annealing(problem, iterations_limit=iterations_limit)
+    elapsed = time.perf_counter() - start
+    return SolveResult(node.state, problem._conflicts(node.state),
+                       problem.evaluations - evaluations, iterations_limit, elapsed)
+
+def run_annealing_engine(initial_state, iterations_limit=10000, schedule=None):
+    """Engine SA trong annealing.py (N bất kỳ); mỗi vòng lặp đánh giá một nước."""
+    start = time.perf_counter()
+    result = anneal(len(initial_state), initial_state, schedule, iterations_limit)
+    elapsed = time.perf_counter() - start
+    return SolveResult(result.state, result.conflicts, result.iterations,
+                       result.iterations, elapsed)
+
+def run_steady_state(population, mutation_rate=0.1, generations=1000):
+    """GA steady-state trong steady_state.py (N bất kỳ, mã hóa tự do)."""
+    start = time.perf_counter()
+    result = steady_state_ga(len(population[0]), population, mutation_rate=mutation_rate,
+                             generations=generations)
+    elapsed = time.perf_counter() - start
+    return SolveResult(result.state, result.conflicts, result.evaluations,
+                       result.generations, elapsed)
+
+ALGORITHMS = ('hill_climbing', 'simulated_annealing', 'genetic', 'annealing', 'steady_state')
+# Các thuật toán này tự sinh state với mã hóa tự do, không dùng ENCODINGS
+FREE_ENCODING_ONLY = ('annealing', 'steady_state')
+
+def solve(algorithm, n=8, seed=None, budget=None, encoding='free', initial_state=None,
+          cache=None):
+    """Giải N quân hậu không in gì ra màn hình, trả về SolveResult.
+
+    budget là số vòng lặp (số thế hệ với GA), phải dương; None dùng mặc định
+    của từng thuật toán. Chỉ 'annealing' và 'steady_state' hỗ trợ N khác 8, và hai
+    thuật toán này chỉ dùng mã hóa 'free'.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Thuật toán không hợp lệ: {algorithm}")
+    if algorithm in FREE_ENCODING_ONLY and encoding != 'free':
+        raise ValueError(f"{algorithm} chỉ hỗ trợ mã hóa 'free', không phải '{encoding}'")
+    if budget is not None and budget <= 0:
+        raise ValueError(f"budget phải là số dương, nhận {budget}")
+    if n < 1:
+        raise ValueError(f"N phải >= 1, nhận N={n}")
+
+    def budget_or(default):
+        return default if budget is None else budget
+
+    if seed is not None:
+        random.seed(seed)
+    if algorithm == 'annealing':
+        if initial_state is None:
+            initial_state = tuple(random.randrange(n) for _ in range(n))
+        return run_annealing_engine(initial_state, budget_or(10000))
+    if algorithm == 'steady_state':
+        if not 3 <= n <= 256:
+            raise ValueError(f"steady_state cần 3 <= N <= 256 (mỗi gen là một byte), nhận N={n}")
+        population = [tuple(random.randrange(n) for _ in range(n)) for _ in range(100)]
+        if initial_state is not None:
+            population[0] = initial_state
+        return run_steady_state(population, generations=budget_or(1000))
+    if n != 8:
+        raise ValueError(f"{algorithm} chỉ hỗ trợ N=8")
+    
+    spec = ENCODINGS[encoding]
+    problem = spec['problem'](initial_state, cache=cache)
+    if algorithm == 'hill_climbing':
+        return run_hill_climbing(problem, budget_or(0))  # 0 = leo đến khi hết bước tốt hơn
+    if algorithm == 'simulated_annealing':
+        return run_simulated_annealing(problem, budget_or(10000))
+    population = [problem.initial_state] + [spec['random_state']() for _ in range(99)]
+    return run_genetic(problem, population, generations=budget_or(1000),
+                       crossover=spec['crossover'], mutate=spec['mutate'])
+
 def print_board(state):
     print("Bàn cờ 8x8 với các quân hậu:")
     print("  " + " ".join(str(i) for i in range(8)))
@@ -75,85 +360,45 @@ def solve_with_hill_climbing():
     print(f"Số conflicts ban đầu: {problem._conflicts(problem.initial_state)}")
     print_board(problem.initial_state)
     
-    start_time = time.time()
-    result = hill_climbing(problem)
-    end_time = time.time()
+    result = run_hill_climbing(problem)
     
-    if result:
+    if result.conflicts == 0:
         print(f"Tìm thấy nghiệm: {result.state}")
-        print(f"Số conflicts: {problem._conflicts(result.state)}")
+        print(f"Số conflicts: {result.conflicts}")
         print_board(result.state)
     else:
         print("Không tìm thấy nghiệm (có thể bị kẹt ở local maximum)")
     
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+    print(f"Thời gian thực hiện: {result.elapsed:.4f} giây")
     print("-" * 50)
     return result
 
 def solve_with_genetic():
     print("=== GENETIC ALGORITHM ===")
-    problem = EightQueensProblem()
+    cache = FitnessCache()
+    problem = EightQueensProblem(cache=cache)
     
     population_size = 100
     mutation_rate = 0.1
     generations = 1000
     
-    start_time = time.time()
     population = [generate_random_state() for _ in range(population_size)]
+    result = run_genetic(problem, population, mutation_rate, generations)
     
-    best_solution = None
-    best_fitness = -1
-    
-    for generation in range(generations):
-        fitness_scores = [problem.value(individual) for individual in population]
-        
-        max_fitness = max(fitness_scores)
-        if max_fitness > best_fitness:
-            best_fitness = max_fitness
-            best_index = fitness_scores.index(max_fitness)
-            best_solution = population[best_index]
-            
-            if max_fitness == 28:
-                break
-        
-        new_population = []
-        
-        for _ in range(population_size // 2):
-            parent1 = tournament_selection(population, fitness_scores)
-            parent2 = tournament_selection(population, fitness_scores)
-            
-            child1, child2 = crossover(parent1, parent2)
-            
-            if random.random() < mutation_rate:
-                child1 = mutate(child1)
-            if random.random() < mutation_rate:
-                child2 = mutate(child2)
-            
-            new_population.extend([child1, child2])
-        
-        population = new_population
-    
-    end_time = time.time()
-    
-    if best_solution and problem._conflicts(best_solution) == 0:
-        print(f"Tìm thấy nghiệm: {best_solution}")
-        print(f"Số conflicts: {problem._conflicts(best_solution)}")
-        print_board(best_solution)
+    if result.conflicts == 0:
+        print(f"Tìm thấy nghiệm: {result.state}")
+        print(f"Số conflicts: {result.conflicts}")
+        print_board(result.state)
     else:
         print("Không tìm thấy nghiệm hoàn hảo")
-        if best_solution:
-            print(f"Nghiệm tốt nhất: {best_solution}")
-            print(f"Số conflicts: {problem._conflicts(best_solution)}")
-            print_board(best_solution)
+        print(f"Nghiệm tốt nhất: {result.state}")
+        print(f"Số conflicts: {result.conflicts}")
+        print_board(result.state)
     
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+    print(f"Thời gian thực hiện: {result.elapsed:.4f} giây")
+    print(cache.report())
     print("-" * 50)
-    
-    class Result:
-        def __init__(self, state):
-            self.state = state
-    
-    return Result(best_solution) if best_solution else None
+    return result
 
 def tournament_selection(population, fitness_scores, tournament_size=3):
     tournament_indices = random.sample(range(len(population)), tournament_size)
@@ -163,23 +408,23 @@ def tournament_selection(population, fitness_scores, tournament_size=3):
 
 def solve_with_simulated_annealing():
     print("=== SIMULATED ANNEALING ===")
-    problem = EightQueensProblem()
+    cache = FitnessCache()
+    problem = EightQueensProblem(cache=cache)
     print(f"State ban đầu: {problem.initial_state}")
     print(f"Số conflicts ban đầu: {problem._conflicts(problem.initial_state)}")
     print_board(problem.initial_state)
     
-    start_time = time.time()
-    result = simulated_annealing(problem, iterations_limit=10000)
-    end_time = time.time()
+    result = run_simulated_annealing(problem, iterations_limit=10000)
     
-    if result:
+    if result.conflicts == 0:
         print(f"Tìm thấy nghiệm: {result.state}")
-        print(f"Số conflicts: {problem._conflicts(result.state)}")
+        print(f"Số conflicts: {result.conflicts}")
         print_board(result.state)
     else:
         print("Không tìm thấy nghiệm")
     
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+    print(f"Thời gian thực hiện: {result.elapsed:.4f} giây")
+    print(cache.report())
     print("-" * 50)
     return result
 
@@ -205,7 +450,7 @@ def compare_algorithms():
             result = algorithm()
             end = time.time()
             
-            if result and EightQueensProblem()._conflicts(result.state) == 0:
+            if result.conflicts == 0:
                 successes += 1
             total_time += (end - start)
         
@@ -221,12 +466,23 @@ def compare_algorithms():
     
     return results
 
-def solve_with_fixed_initial_state():
+def solve_with_fixed_initial_state(encodings=None):
+    """encodings: dict tên thuật toán -> 'free' | 'permutation' | 'permutation-pmx'.
+
+    Thuật toán không có trong dict dùng biểu diễn 'free' (mỗi hàng một cột bất kỳ).
+    """
+    encodings = encodings or {}
+    hc_encoding = ENCODINGS[encodings.get('Hill Climbing', 'free')]
+    ga_encoding = ENCODINGS[encodings.get('Genetic Algorithm', 'free')]
+    sa_encoding = ENCODINGS[encodings.get('Simulated Annealing', 'free')]
+    
     print("GIẢI BÀI TOÁN 8 QUÂN HẬU BẰNG SIMPLEAI")
     print("=" * 60)
     
     initial_state = (0, 1, 2, 3, 4, 5, 6, 7)
     print(f"State đầu cố định cho cả 3 thuật toán: {initial_state}")
+    for name in ('Hill Climbing', 'Genetic Algorithm', 'Simulated Annealing'):
+        print(f"Biểu diễn cho {name}: {encodings.get(name, 'free')}")
     problem_temp = EightQueensProblem(initial_state)
     print(f"Số conflicts ban đầu: {problem_temp._conflicts(initial_state)}")
     print_board(initial_state)
@@ -234,136 +490,75 @@ def solve_with_fixed_initial_state():
     results = {}
     
     print("=== 1. HILL CLIMBING ===")
-    problem1 = EightQueensProblem(initial_state)
-    start_time = time.time()
-    result1 = hill_climbing(problem1)
-    end_time = time.time()
+    problem1 = hc_encoding['problem'](initial_state)
+    result1 = run_hill_climbing(problem1)
     
-    if result1:
+    if result1.conflicts == 0:
         print(f"Tìm thấy nghiệm: {result1.state}")
-        print(f"Số conflicts: {problem1._conflicts(result1.state)}")
+        print(f"Số conflicts: {result1.conflicts}")
         print_board(result1.state)
-        results['Hill Climbing'] = {
-            'success': problem1._conflicts(result1.state) == 0,
-            'final_state': result1.state,
-            'conflicts': problem1._conflicts(result1.state),
-            'time': end_time - start_time
-        }
     else:
         print("Không tìm thấy nghiệm (có thể bị kẹt ở local maximum)")
-        results['Hill Climbing'] = {
-            'success': False,
-            'final_state': None,
-            'conflicts': float('inf'),
-            'time': end_time - start_time
-        }
-    
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+    results['Hill Climbing'] = {
+        'success': result1.conflicts == 0,
+        'final_state': result1.state,
+        'conflicts': result1.conflicts,
+        'time': result1.elapsed
+    }
+    
+    print(f"Thời gian thực hiện: {result1.elapsed:.4f} giây")
     print("-" * 50)
     
     print("=== 2. GENETIC ALGORITHM ===")
-    problem2 = EightQueensProblem(initial_state)
+    cache = FitnessCache()
+    problem2 = ga_encoding['problem'](initial_state, cache=cache)
     
     population_size = 100
     mutation_rate = 0.1
     generations = 1000
     
-    start_time = time.time()
-    population = [initial_state] + [generate_random_state() for _ in range(population_size - 1)]
-    
-    best_solution = None
-    best_fitness = -1
+    population = [initial_state] + [ga_encoding['random_state']() for _ in range(population_size - 1)]
+    result2 = run_genetic(problem2, population, mutation_rate, generations,
+                          ga_encoding['crossover'], ga_encoding['mutate'])
     
-    for generation in range(generations):
-        fitness_scores = [problem2.value(individual) for individual in population]
-        
-        max_fitness = max(fitness_scores)
-        if max_fitness > best_fitness:
-            best_fitness = max_fitness
-            best_index = fitness_scores.index(max_fitness)
-            best_solution = population[best_index]
-            
-            if max_fitness == 28:
-                break
-        
-        new_population = []
-        
-        for _ in range(population_size // 2):
-            parent1 = tournament_selection(population, fitness_scores)
-            parent2 = tournament_selection(population, fitness_scores)
-            
-            child1, child2 = crossover(parent1, parent2)
-            
-            if random.random() < mutation_rate:
-                child1 = mutate(child1)
-            if random.random() < mutation_rate:
-                child2 = mutate(child2)
-            
-            new_population.extend([child1, child2])
-        
-        population = new_population
-    
-    end_time = time.time()
-    
-    if best_solution and problem2._conflicts(best_solution) == 0:
-        print(f"Tìm thấy nghiệm: {best_solution}")
-        print(f"Số conflicts: {problem2._conflicts(best_solution)}")
-        print_board(best_solution)
-        results['Genetic Algorithm'] = {
-            'success': True,
-            'final_state': best_solution,
-            'conflicts': problem2._conflicts(best_solution),
-            'time': end_time - start_time
-        }
+    if result2.conflicts == 0:
+        print(f"Tìm thấy nghiệm: {result2.state}")
+        print(f"Số conflicts: {result2.conflicts}")
+        print_board(result2.state)
     else:
         print("Không tìm thấy nghiệm hoàn hảo")
-        if best_solution:
-            print(f"Nghiệm tốt nhất: {best_solution}")
-            print(f"Số conflicts: {problem2._conflicts(best_solution)}")
-            print_board(best_solution)
-            results['Genetic Algorithm'] = {
-                'success': False,
-                'final_state': best_solution,
-                'conflicts': problem2._conflicts(best_solution),
-                'time': end_time - start_time
-            }
-        else:
-            results['Genetic Algorithm'] = {
-                'success': False,
-                'final_state': None,
-                'conflicts': float('inf'),
-                'time': end_time - start_time
-            }
-    
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+        print(f"Nghiệm tốt nhất: {result2.state}")
+        print(f"Số conflicts: {result2.conflicts}")
+        print_board(result2.state)
+    results['Genetic Algorithm'] = {
+        'success': result2.conflicts == 0,
+        'final_state': result2.state,
+        'conflicts': result2.conflicts,
+        'time': result2.elapsed
+    }
+    
+    print(f"Thời gian thực hiện: {result2.elapsed:.4f} giây")
     print("-" * 50)
 
     print("=== 3. SIMULATED ANNEALING ===")
-    problem3 = EightQueensProblem(initial_state)
-    start_time = time.time()
-    result3 = simulated_annealing(problem3, iterations_limit=10000)
-    end_time = time.time()
+    problem3 = sa_encoding['problem'](initial_state, cache=cache)
+    result3 = run_simulated_annealing(problem3, iterations_limit=10000)
     
-    if result3:
+    if result3.conflicts == 0:
         print(f"Tìm thấy nghiệm: {result3.state}")
-        print(f"Số conflicts: {problem3._conflicts(result3.state)}")
+        print(f"Số conflicts: {result3.conflicts}")
         print_board(result3.state)
-        results['Simulated Annealing'] = {
-            'success': problem3._conflicts(result3.state) == 0,
-            'final_state': result3.state,
-            'conflicts': problem3._conflicts(result3.state),
-            'time': end_time - start_time
-        }
     else:
         print("Không tìm thấy nghiệm")
-        results['Simulated Annealing'] = {
-            'success': False,
-            'final_state': None,
-            'conflicts': float('inf'),
-            'time': end_time - start_time
-        }
-    
-    print(f"Thời gian thực hiện: {end_time - start_time:.4f} giây")
+    results['Simulated Annealing'] = {
+        'success': result3.conflicts == 0,
+        'final_state': result3.state,
+        'conflicts': result3.conflicts,
+        'time': result3.elapsed
+    }
+    
+    print(f"Thời gian thực hiện: {result3.elapsed:.4f} giây")
+    print(cache.report())
     print("-" * 50)
     
     print("=== SO SÁNH KẾT QUẢ ===")
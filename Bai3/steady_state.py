@@ -0,0 +1,279 @@
+"""
+GA steady-state cho N quân hậu (mã hóa tự do: state[hàng] = cột).
+
+Khác với vòng lặp thế hệ của run_genetic (mỗi thế hệ tạo list quần thể mới,
+tuple con mới...), ở đây mọi dữ liệu được cấp phát một lần:
+- genomes: bytearray population_size * n, mỗi cá thể là một đoạn n byte,
+- offspring: bytearray 2 * n, bộ đệm thứ hai để ghi hai con,
+- fitness: list số nguyên, kèm một min-heap chỉ mục để biết cá thể tệ nhất.
+Lai ghép và đột biến ghi thẳng vào offspring; con tốt hơn cá thể tệ nhất
+được chép đè lên chỗ của cá thể đó. Đột biến một gen chỉ tính lại các cặp
+đi qua hàng đó (O(n)) thay vì đếm lại toàn bộ conflicts; con chỉ khác cha
+mẹ ở ít hàng cũng được tính từ fitness của cha mẹ theo cách đó.
+"""
+
+import random
+import time
+from collections import namedtuple
+
+# evaluations: mọi lần chấm điểm (quần thể đầu + mỗi con), như problem.evaluations của GA
+# full_recounts: số lần trong đó phải đếm lại toàn bộ O(n^2) cặp
+SteadyStateResult = namedtuple('SteadyStateResult',
+                               'state conflicts offspring evaluations full_recounts generations')
+
+
+class FitnessHeap:
+    """Min-heap các chỉ số cá thể theo fitness; pos[i] là vị trí của cá thể i trong heap."""
+
+    def __init__(self, fitness):
+        self.fitness = fitness
+        self.heap = list(range(len(fitness)))
+        self.pos = list(range(len(fitness)))
+        for i in reversed(range(len(fitness) // 2)):
+            self._sift_down(i)
+
+    def worst(self):
+        return self.heap[0]
+
+    def update(self, individual):
+        """Gọi sau khi fitness[individual] thay đổi"""
+        self._sift_up(self.pos[individual])
+        self._sift_down(self.pos[individual])
+
+    def _sift_up(self, i):
+        heap, pos, fitness = self.heap, self.pos, self.fitness
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if fitness[heap[parent]] <= fitness[item]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, pos, fitness = self.heap, self.pos, self.fitness
+        size = len(heap)
+        item = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and fitness[heap[child + 1]] < fitness[heap[child]]:
+                child += 1
+            if fitness[item] <= fitness[heap[child]]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+
+def _conflicts(genes, start, n):
+    """Số cặp hậu ăn nhau của cá thể nằm ở genes[start:start + n]"""
+    conflicts = 0
+    for i in range(n):
+        a = genes[start + i]
+        for j in range(i + 1, n):
+            b = genes[start + j]
+            if a == b or abs(a - b) == j - i:
+                conflicts += 1
+    return conflicts
+
+
+def _conflicts_at(genes, start, n, row, col):
+    """Số hậu ăn quân hậu đặt ở (row, col), không tính chính hàng row"""
+    conflicts = 0
+    for j in range(n):
+        if j != row:
+            b = genes[start + j]
+            if b == col or abs(b - col) == abs(j - row):
+                conflicts += 1
+    return conflicts
+
+
+def _tournament(fitness, size, randrange):
+    """Tournament 3 trên chỉ số, không tạo list/sample như tournament_selection"""
+    winner = randrange(size)
+    for _ in range(2):
+        rival = randrange(size)
+        if fitness[rival] > fitness[winner]:
+            winner = rival
+    return winner
+
+
+def steady_state_ga(n=8, population=None, population_size=100, mutation_rate=0.1,
+                    generations=1000, rng=random, on_generation=None):
+    """
+    Mỗi bước chọn hai cha mẹ bằng tournament 3, lai một điểm thành hai con,
+    đột biến mỗi con với xác suất mutation_rate và thay cá thể tệ nhất nếu
+    con tốt hơn. Một "thế hệ" là population_size con, để so sánh được với
+    run_genetic; on_generation(thế hệ) được gọi sau mỗi thế hệ.
+    """
+    if population is not None:
+        population_size = len(population)
+    max_pairs = n * (n - 1) // 2
+    genomes = bytearray(population_size * n)
+    offspring = bytearray(2 * n)
+    genome_view, offspring_view = memoryview(genomes), memoryview(offspring)
+
+    for i in range(population_size):
+        state = population[i] if population is not None else [rng.randrange(n) for _ in range(n)]
+        genomes[i * n:(i + 1) * n] = bytes(state)
+    fitness = [max_pairs - _conflicts(genomes, i * n, n) for i in range(population_size)]
+    full_recounts = population_size
+    heap = FitnessHeap(fitness)
+    best = max(range(population_size), key=fitness.__getitem__)
+
+    randrange, random_ = rng.randrange, rng.random
+    # Mỗi hàng khác nhau tốn khoảng 4n phép so sánh, đếm lại toàn bộ tốn n^2 / 2
+    incremental_limit = 8
+    scores = [0, 0]
+    offspring_count = 0
+    generation = 0
+    while fitness[best] < max_pairs and generation < generations:
+        for _ in range(population_size // 2):
+            a = _tournament(fitness, population_size, randrange) * n
+            b = _tournament(fitness, population_size, randrange) * n
+            cut = randrange(1, n - 1)
+            offspring_view[:cut] = genome_view[a:a + cut]
+            offspring_view[cut:n] = genome_view[b + cut:b + n]
+            offspring_view[n:n + cut] = genome_view[b:b + cut]
+            offspring_view[n + cut:] = genome_view[a + cut:a + n]
+            # Con 1 là cha a với các hàng cut..n-1 lấy từ b (con 2 ngược lại). Khi cha mẹ
+            # khác nhau ít hàng, tính conflicts từ fitness của cha mẹ bằng từng bước O(n)
+            # rẻ hơn đếm lại cả O(n^2) cặp.
+            differing = 0
+            for row in range(cut, n):
+                if genomes[a + row] != genomes[b + row]:
+                    differing += 1
+
+            # Chấm điểm cả hai con trước khi thay thế: con 1 có thể đè lên chỗ của
+            # cha a hoặc b mà con 2 còn đọc tới
+            for k, (child, parent, other) in enumerate(((0, a, b), (n, b, a))):
+                if differing * incremental_limit <= n:
+                    conflicts = max_pairs - fitness[parent // n]
+                    if differing:
+                        # Dựng lại con từ cha `parent` từng hàng một
+                        offspring_view[child:child + n] = genome_view[parent:parent + n]
+                        for row in range(cut, n):
+                            col = genomes[other + row]
+                            old = offspring[child + row]
+                            if col != old:
+                                conflicts -= _conflicts_at(offspring, child, n, row, old)
+                                offspring[child + row] = col
+                                conflicts += _conflicts_at(offspring, child, n, row, col)
+                else:
+                    conflicts = _conflicts(offspring, child, n)
+                    full_recounts += 1
+                if random_() < mutation_rate:
+                    row, col = randrange(n), randrange(n)
+                    old = offspring[child + row]
+                    if col != old:
+                        conflicts -= _conflicts_at(offspring, child, n, row, old)
+                        offspring[child + row] = col
+                        conflicts += _conflicts_at(offspring, child, n, row, col)
+                scores[k] = max_pairs - conflicts
+            offspring_count += 2
+
+            for k, child in ((0, 0), (1, n)):
+                value = scores[k]
+                worst = heap.worst()
+                if value > fitness[worst]:
+                    genome_view[worst * n:(worst + 1) * n] = offspring_view[child:child + n]
+                    fitness[worst] = value
+                    heap.update(worst)
+                    if value > fitness[best]:
+                        best = worst
+        generation += 1
+        if on_generation is not None:
+            on_generation(generation)
+
+    return SteadyStateResult(tuple(genomes[best * n:(best + 1) * n]), max_pairs - fitness[best],
+                             offspring_count, population_size + offspring_count, full_recounts, generation)
+
+
+def _allocation_tracker():
+    """on_generation ghi lại đỉnh bộ nhớ tạm (byte) cấp phát trong từng thế hệ"""
+    import tracemalloc
+
+    samples = []
+    baseline = [tracemalloc.get_traced_memory()[0]]
+    tracemalloc.reset_peak()
+
+    def on_generation(generation):
+        current, peak = tracemalloc.get_traced_memory()
+        samples.append(peak - baseline[0])
+        baseline[0] = current
+        tracemalloc.reset_peak()
+    return samples, on_generation
+
+
+def compare(generations=200, runs=5, seed=0):
+    """
+    So sánh vòng lặp thế hệ (run_genetic, mã hóa tự do) với GA steady-state
+    trên cùng số thế hệ: số con/giây, tỷ lệ tìm được nghiệm và đỉnh bộ nhớ
+    tạm mỗi thế hệ (đo bằng tracemalloc trong một lượt chạy riêng).
+    """
+    import statistics
+    import tracemalloc
+
+    from main import EightQueensProblem, generate_random_state, run_genetic
+
+    def generational(on_generation=None):
+        problem = EightQueensProblem()
+        population = [generate_random_state() for _ in range(100)]
+        result = run_genetic(problem, population, generations=generations, on_generation=on_generation)
+        return result.conflicts == 0, result.iterations * 100
+
+    def steady(on_generation=None):
+        population = [generate_random_state() for _ in range(100)]
+        result = steady_state_ga(8, population, generations=generations, on_generation=on_generation)
+        return result.conflicts == 0, result.offspring
+
+    report = {}
+    for name, run in (('generational', generational), ('steady_state', steady)):
+        successes = offspring = 0
+        elapsed = 0.0
+        for i in range(runs):
+            random.seed(seed + i)
+            start = time.perf_counter()
+            solved, children = run()
+            elapsed += time.perf_counter() - start
+            successes += solved
+            offspring += children
+
+        random.seed(seed)
+        tracemalloc.start()
+        samples, on_generation = _allocation_tracker()
+        run(on_generation)
+        tracemalloc.stop()
+        report[name] = {
+            'success_rate': successes / runs,
+            'offspring_per_second': offspring / elapsed if elapsed else 0.0,
+            'bytes_per_generation': statistics.median(samples) if samples else 0,
+        }
+    return report
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GA steady-state so với vòng lặp thế hệ (8 quân hậu)")
+    parser.add_argument('--generations', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = compare(args.generations, args.runs, args.seed)
+    print(f"{'GA':<14} {'con/giây':>12} {'thành công':>11} {'byte tạm/thế hệ':>16}")
+    for name, row in report.items():
+        print(f"{name:<14} {row['offspring_per_second']:>12,.0f} {row['success_rate'] * 100:>10.0f}% "
+              f"{row['bytes_per_generation']:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import pytest
+
+from main import solve
+
+
+@pytest.mark.parametrize('algorithm, n, budget', [
+    ('genetic', 8, -1),
+    ('genetic', 8, 0),
+    ('annealing', 0, None),
+    ('annealing', -3, None),
+])
+def test_rejects_invalid_budget_and_size(algorithm, n, budget):
+    with pytest.raises(ValueError):
+        solve(algorithm, n, seed=0, budget=budget)
+
+
+def test_explicit_budget_is_used():
+    assert solve('genetic', seed=0, budget=1).iterations == 1
+    assert solve('annealing', seed=0, budget=5).iterations <= 5
@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+from main import EightQueensProblem, solve
+from steady_state import _conflicts, steady_state_ga
+
+
+def test_reported_conflicts_match_returned_state():
+    problem = EightQueensProblem()
+    for seed in range(200):
+        result = solve('steady_state', 8, seed=seed, budget=200)
+        assert result.conflicts == problem._conflicts(result.state), seed
+
+
+def test_small_populations_keep_fitness_in_sync():
+    # Quần thể nhỏ khiến con 1 thường đè lên cha mẹ mà con 2 còn dùng
+    for size in range(4, 7):
+        for seed in range(300):
+            rng = random.Random(seed)
+            result = steady_state_ga(8, population_size=size, generations=50, rng=rng)
+            assert 0 <= result.conflicts == _conflicts(bytes(result.state), 0, 8), (size, seed)
+
+
+def test_rejects_board_sizes_outside_byte_genes():
+    for n in (2, 257):
+        with pytest.raises(ValueError):
+            solve('steady_state', n)
@@ -0,0 +1,55 @@
+# Bàn cờ 3x3 dạng bitboard: ô (i, j) ứng với bit i*3 + j của mask
+FULL_BOARD = 0b111111111
+WIN_LINES = (
+    0b000000111, 0b000111000, 0b111000000,  # hàng ngang
+    0b001001001, 0b010010010, 0b100100100,  # hàng dọc
+    0b100010001, 0b001010100,               # đường chéo chính, đường chéo phụ
+)
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+def winner(x, o):
+    """0 = chưa có winner, 1 = X thắng, 2 = O thắng"""
+    for line in WIN_LINES:
+        if x & line == line:
+            return 1
+        if o & line == line:
+            return 2
+    return 0
+
+def iter_bits(mask):
+    """Lần lượt trả về chỉ số các bit bật trong mask"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+# LINES_THROUGH[ô] = các đường thắng đi qua ô đó (2 đến 4 đường)
+LINES_THROUGH = tuple(tuple(line for line in WIN_LINES if line >> cell & 1) for cell in range(9))
+
+
+def _splitmix64(seed, count):
+    """count số ngẫu nhiên 64 bit cố định theo seed (không cần import random khi khởi động)"""
+    values = []
+    for _ in range(count):
+        seed = (seed + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = seed
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        values.append(z ^ (z >> 31))
+    return values
+
+# Khóa Zobrist: ZOBRIST[player][ô], giống nhau ở mọi tiến trình vì sinh từ seed cố định.
+# Không có khóa cho lượt đi, cùng lý do với TicTacToe.ttentry().
+_KEYS = _splitmix64(0x7A0B, 18)
+ZOBRIST = ((0,) * 9, tuple(_KEYS[:9]), tuple(_KEYS[9:]))
+
+def zobrist_hash(x, o):
+    """Tính lại từ đầu hash Zobrist của thế cờ (dùng khi khôi phục bàn cờ)"""
+    h = 0
+    for cell in iter_bits(x):
+        h ^= ZOBRIST[1][cell]
+    for cell in iter_bits(o):
+        h ^= ZOBRIST[2][cell]
+    return h
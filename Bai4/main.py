@@ -1,67 +1,98 @@
 from easyAI import TwoPlayerGame, Human_Player, AI_Player, Negamax
-import numpy as np
+from easyAI.AI import TranspositionTable
+
+from bitboard import FULL_BOARD, LINES_THROUGH, ZOBRIST, popcount, winner as find_winner, zobrist_hash
+
+# mcts, mnk và solution_table chỉ được import trong chế độ chơi cần đến chúng,
+# để khởi động (và các script chỉ dùng TicTacToe) không phải trả chi phí đó
+
 
 class TicTacToe(TwoPlayerGame):
     def __init__(self, players):
-        # Khởi tạo bàn cờ 3x3 rỗng (0 = trống, 1 = X, 2 = O)
-        self.board = np.zeros((3, 3), dtype=int)
+        # Bàn cờ 3x3 lưu bằng hai mask 9 bit: masks[1] cho X, masks[2] cho O
+        # (masks[0] không dùng để đánh chỉ số trực tiếp bằng current_player)
+        self.masks = [0, 0, 0]
         self.players = players
         self.current_player = 1  # Player 1 chơi trước (X)
+        # Cập nhật trong make_move/unmake_move để is_over, lose, scoring chỉ cần đọc
+        self.move_count = 0
+        self.winner = 0
+        self.hash = 0  # hash Zobrist, cập nhật tăng dần bằng XOR khi đi/hoàn tác
+    
+    def cell(self, i, j):
+        """Trả về 0 = trống, 1 = X, 2 = O"""
+        bit = 1 << (i * 3 + j)
+        if self.masks[1] & bit:
+            return 1
+        if self.masks[2] & bit:
+            return 2
+        return 0
     
     def possible_moves(self):
+        """Nước đi là chỉ số ô 0..8 (= hàng*3 + cột)"""
         moves = []
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == 0:
-                    moves.append(f"{i},{j}")
+        empty = FULL_BOARD & ~(self.masks[1] | self.masks[2])
+        while empty:
+            low = empty & -empty
+            moves.append(low.bit_length() - 1)
+            empty ^= low
         return moves
     
     def make_move(self, move):
-        i, j = map(int, move.split(','))
-        self.board[i][j] = self.current_player
+        player = self.current_player
+        mask = self.masks[player] | (1 << move)
+        self.masks[player] = mask
+        self.move_count += 1
+        self.hash ^= ZOBRIST[player][move]
+        # Chỉ cần kiểm tra các đường đi qua ô vừa đánh
+        for line in LINES_THROUGH[move]:
+            if mask & line == line:
+                self.winner = player
+                break
     
     def unmake_move(self, move):
         """Hoàn tác nước đi (cần thiết cho thuật toán Minimax)"""
-        i, j = map(int, move.split(','))  # Parse string move
-        self.board[i][j] = 0
+        self.masks[self.current_player] &= ~(1 << move)
+        self.move_count -= 1
+        self.hash ^= ZOBRIST[self.current_player][move]
+        # Không thể đi tiếp sau khi đã có người thắng, nên trước nước này chưa ai thắng
+        self.winner = 0
+    
+    def ttentry(self):
+        """
+        Khóa cho bảng chuyển vị: hai mask ghép thành một số nguyên 18 bit.
+        Người đi tiếp suy ra được từ số quân X/O nên không cần đưa vào khóa.
+        """
+        return (self.masks[1] << 9) | self.masks[2]
+    
+    def ttrestore(self, entry):
+        """Khôi phục bàn cờ từ khóa của ttentry()"""
+        self.masks = [0, entry >> 9, entry & FULL_BOARD]
+        x_count, o_count = popcount(self.masks[1]), popcount(self.masks[2])
+        self.current_player = 1 if x_count == o_count else 2
+        self.move_count = x_count + o_count
+        self.winner = find_winner(self.masks[1], self.masks[2])
+        self.hash = zobrist_hash(self.masks[1], self.masks[2])
     
     def lose(self):
-        return self.check_winner() == (3 - self.current_player)
+        return self.winner == (3 - self.current_player)
     
     def is_over(self):
-        return self.check_winner() != 0 or len(self.possible_moves()) == 0
+        return self.winner != 0 or self.move_count == 9
     
     def check_winner(self):
         """
-        Kiểm tra người thắng
+        Người thắng, được cập nhật sau mỗi nước đi
         Trả về: 0 = chưa có winner, 1 = player 1 (X), 2 = player 2 (O)
         """
-        # Kiểm tra hàng ngang
-        for i in range(3):
-            if self.board[i][0] == self.board[i][1] == self.board[i][2] != 0:
-                return self.board[i][0]
-        
-        # Kiểm tra hàng dọc
-        for j in range(3):
-            if self.board[0][j] == self.board[1][j] == self.board[2][j] != 0:
-                return self.board[0][j]
-        
-        # Kiểm tra đường chéo chính
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != 0:
-            return self.board[0][0]
-        
-        # Kiểm tra đường chéo phụ
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != 0:
-            return self.board[0][2]
-        
-        return 0
+        return self.winner
     
     def scoring(self):
         """
         Hàm đánh giá cho thuật toán Minimax
         Trả về điểm số từ góc nhìn của người chơi hiện tại
         """
-        winner = self.check_winner()
+        winner = self.winner
         if winner == self.current_player:
             return 100  # Thắng
         elif winner == (3 - self.current_player):
@@ -69,19 +100,31 @@ class TicTacToe(TwoPlayerGame):
         else:
             return 0  # Hòa hoặc chưa kết thúc
     
-    def show(self):
+    def render(self):
+        """Bàn cờ dạng chuỗi nhiều dòng (dùng cho show() và cho server)"""
         symbols = {0: ' ', 1: 'X', 2: 'O'}
-        print("\n   0   1   2")
-        print("  -----------")
+        lines = ["", "   0   1   2", "  -----------"]
         for i in range(3):
             row = f"{i} | "
             for j in range(3):
-                row += f"{symbols[self.board[i][j]]} | "
-            print(row)
-            print("  -----------")
+                row += f"{symbols[self.cell(i, j)]} | "
+            lines.append(row)
+            lines.append("  -----------")
+        return "\n".join(lines)
+    
+    def show(self):
+        print(self.render())
         print()
     
+    def move_label(self, move):
+        """Chỉ số ô -> 'hàng,cột' để hiển thị cho người chơi"""
+        return f"{move // 3},{move % 3}"
+    
+    def format_moves(self):
+        return [self.move_label(move) for move in self.possible_moves()]
+    
     def ask_player(self, player):
+        """Đọc nước đi dạng 'hàng,cột' và trả về chỉ số ô"""
         self.show()
         while True:
             try:
@@ -96,30 +139,54 @@ class TicTacToe(TwoPlayerGame):
                     parts = move_str.split()
                     i, j = int(parts[0]), int(parts[1])
                 
-                # Create move string and check if valid
-                move = f"{i},{j}"
-                if move in self.possible_moves():
-                    return move
+                # Check if the move is a valid empty cell
+                if 0 <= i < 3 and 0 <= j < 3 and i * 3 + j in self.possible_moves():
+                    return i * 3 + j
                 else:
                     print("Nước đi không hợp lệ! Vui lòng chọn ô trống.")
-                    print("Các nước đi hợp lệ:", self.possible_moves())
-            except:
+                    print("Các nước đi hợp lệ:", self.format_moves())
+            except (ValueError, IndexError):
                 print("Format không đúng! Vui lòng nhập theo format 'hàng,cột' (ví dụ: 1,2)")
-                print("Các nước đi hợp lệ:", self.possible_moves())
+                print("Các nước đi hợp lệ:", self.format_moves())
+
 
+class TicTacToeHuman(Human_Player):
+    """Người chơi nhập nước đi theo format 'hàng,cột' qua TicTacToe.ask_player"""
+    
+    def ask_move(self, game):
+        return game.ask_player(game.current_player)
+
+
+def play(game):
+    """
+    Như TwoPlayerGame.play() của easyAI, nhưng in nước đi bằng game.move_label
+    ('hàng,cột') thay vì chỉ số ô trên bitboard
+    """
+    game.show()
+    game.nmove = 1
+    while not game.is_over():
+        move = game.player.ask_move(game)
+        game.make_move(move)
+        print(f"\nMove #{game.nmove}: player {game.current_player} plays {game.move_label(move)} :")
+        game.show()
+        game.switch_player()
+        game.nmove += 1
 
-def play_game():
+
+def play_game(ai_algo=None):
     print("=== TIC TAC TOE với Minimax Algorithm ===")
     print("Bạn là X, AI là O")
     print("Nhập tọa độ theo format 'hàng,cột'. VD: 0,1")
     
-    # Tạo AI player với thuật toán Negamax (tương đương Minimax với Alpha-Beta pruning)
-    # Depth = 9 đảm bảo AI chơi hoàn hảo (vì Tic Tac Toe có tối đa 9 nước)
-    ai_algo = Negamax(9)
+    if ai_algo is None:
+        # Tạo AI player với thuật toán Negamax (tương đương Minimax với Alpha-Beta pruning)
+        # Depth = 9 đảm bảo AI chơi hoàn hảo (vì Tic Tac Toe có tối đa 9 nước)
+        # Bảng chuyển vị giúp không tìm kiếm lại các thế cờ đã gặp theo thứ tự nước khác
+        ai_algo = Negamax(9, tt=TranspositionTable())
     
-    game = TicTacToe([Human_Player(), AI_Player(ai_algo)])
+    game = TicTacToe([TicTacToeHuman(), AI_Player(ai_algo)])
     
-    game.play()
+    play(game)
     
     winner = game.check_winner()
     if winner == 1:
@@ -130,16 +197,18 @@ def play_game():
         print("Trò chơi hòa!")
 
 
-def demo_ai_vs_ai():
+def demo_ai_vs_ai(strong_algo=None):
     print("\n=== AI vs AI ===")
     print("Giả lập 2 AI đấu với nhau")
     
-    # Tạo 2 AI với độ sâu khác nhau
-    ai1 = AI_Player(Negamax(9))  # AI mạnh
-    ai2 = AI_Player(Negamax(5))  # AI yếu hơn
+    # Tạo 2 AI với độ sâu khác nhau, dùng chung một bảng chuyển vị
+    # (mỗi entry lưu độ sâu đã tìm nên AI nông không làm hỏng kết quả của AI sâu)
+    tt = TranspositionTable()
+    ai1 = AI_Player(strong_algo or Negamax(9, tt=tt))  # AI mạnh
+    ai2 = AI_Player(Negamax(5, tt=tt))  # AI yếu hơn
     
     game = TicTacToe([ai1, ai2])
-    game.play()
+    play(game)
     
     winner = game.check_winner()
     if winner == 1:
@@ -150,20 +219,55 @@ def demo_ai_vs_ai():
         print("Trò chơi hòa!")
 
 
+def play_gomoku(m=15, n=15, k=5, time_limit=1.0):
+    print(f"=== GOMOKU {m}x{n}: {k} quân liên tiếp để thắng ===")
+    print("Bạn là X, AI là O")
+    print(f"AI dùng alpha-beta với iterative deepening, tối đa {time_limit} giây mỗi nước")
+    from mnk import AlphaBeta, MNKGame
+    
+    game = MNKGame([TicTacToeHuman(), AI_Player(AlphaBeta(time_limit))], m, n, k)
+    play(game)
+    
+    winner = game.check_winner()
+    if winner == 1:
+        print("Chúc mừng! Bạn đã thắng!")
+    elif winner == 2:
+        print("AI thắng! Chúc bạn may mắn lần sau!")
+    else:
+        print("Trò chơi hòa!")
+
+
+def load_solution_table():
+    """Bảng lời giải hoàn hảo thay cho Negamax(9): đọc từ đĩa (lần đầu sẽ giải và ghi ra)"""
+    from solution_table import SolutionTable
+    return SolutionTable.load_or_build()
+
+
 if __name__ == "__main__":
+    solution_table = None  # chỉ nạp khi chọn chế độ 1 hoặc 3
+    
     while True:
         print("-------------------------------")
         print("Chọn chế độ chơi:")
-        print("1. Chơi với AI")
-        print("2. AI vs AI")
-        print("3. Thoát")
-        choice = input("Nhập lựa chọn (1, 2 hoặc 3): ")
+        print("1. Chơi với AI (Negamax / bảng lời giải)")
+        print("2. Chơi với AI (MCTS, 500ms mỗi nước)")
+        print("3. AI vs AI")
+        print("4. Gomoku 15x15 với AI")
+        print("5. Thoát")
+        choice = input("Nhập lựa chọn (1-5): ")
 
         if choice == "1":
-            play_game() 
+            solution_table = solution_table or load_solution_table()
+            play_game(solution_table) 
         elif choice == "2":
-            demo_ai_vs_ai()
+            from mcts import MCTS
+            play_game(MCTS(time_limit_ms=500))
         elif choice == "3":
+            solution_table = solution_table or load_solution_table()
+            demo_ai_vs_ai(solution_table)
+        elif choice == "4":
+            play_gomoku()
+        elif choice == "5":
             print("Cảm ơn bạn đã chơi!")
             break
         else:
@@ -0,0 +1,204 @@
+"""
+Monte Carlo Tree Search (UCT) cho TicTacToe và MNKGame.
+
+Cây được lưu bằng các list song song (không có object cho từng node); các
+con của một node nằm liền nhau trong khoảng [first_child, first_child + count).
+Mỗi lá mới được đánh giá bằng một lô rollout ngẫu nhiên, và cây con ứng với
+nước đi thực tế được giữ lại cho lượt sau.
+"""
+
+import math
+import random
+import time
+
+
+class MCTS:
+    """
+    Dùng được như thuật toán AI của easyAI:
+
+        >>> game = TicTacToe([TicTacToeHuman(), AI_Player(MCTS(time_limit_ms=300))])
+
+    Sau mỗi lần gọi, iterations/nodes/reused/score/elapsed mô tả lần tìm kiếm
+    vừa xong; score là tỷ lệ thắng của nước được chọn, đưa về [-1, 1].
+    """
+
+    def __init__(self, time_limit_ms=500, exploration=1.4, rollouts_per_leaf=4,
+                 max_nodes=1_000_000, rng=None):
+        self.time_limit_ms = time_limit_ms
+        self.exploration = exploration
+        self.rollouts_per_leaf = rollouts_per_leaf
+        self.max_nodes = max_nodes
+        self.rng = rng or random.Random()
+        self._reset()
+        self._expected_moves = None
+        self.iterations = 0
+        self.reused = 0
+        self.score = 0.0
+        self.elapsed = 0.0
+
+    def _reset(self):
+        self.parent = [-1]
+        self.move = [-1]
+        self.mover = [0]
+        self.first_child = [0]
+        self.child_count = [0]
+        self.visits = [0]
+        self.wins = [0.0]
+
+    @property
+    def nodes(self):
+        return len(self.visits)
+
+    def __call__(self, game):
+        start = time.perf_counter()
+        deadline = start + self.time_limit_ms / 1000
+        self._advance_root(game)
+        self.mover[0] = 3 - game.current_player
+
+        iterations = 0
+        while True:
+            self._iterate(game)
+            iterations += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        root_first, root_count = self.first_child[0], self.child_count[0]
+        best = max(range(root_first, root_first + root_count), key=self.visits.__getitem__)
+        best_move = self.move[best]
+        self.score = 2 * self.wins[best] / self.visits[best] - 1 if self.visits[best] else 0.0
+
+        self._expected_moves = set(game.possible_moves())
+        self._expected_moves.discard(best_move)
+        self._chosen = best
+        self.iterations = iterations
+        self.elapsed = time.perf_counter() - start
+        return best_move
+
+    def _advance_root(self, game):
+        """Giữ lại cây con ứng với nước đã chọn và nước đối thủ vừa đi, nếu tìm được"""
+        self.reused = 0
+        if self._expected_moves is None:
+            self._reset()
+            return
+        current = set(game.possible_moves())
+        played = self._expected_moves - current
+        if len(played) != 1 or not current <= self._expected_moves:
+            self._reset()
+            return
+        opponent_move = played.pop()
+        node = self._chosen
+        first, count = self.first_child[node], self.child_count[node]
+        for child in range(first, first + count):
+            if self.move[child] == opponent_move:
+                self._reroot(child)
+                self.reused = self.visits[0]
+                return
+        self._reset()
+
+    def _reroot(self, new_root):
+        """Chép cây con gốc new_root sang các list mới (duyệt theo chiều rộng)"""
+        parent, move, mover = [-1], [self.move[new_root]], [self.mover[new_root]]
+        first_child, child_count = [0], [0]
+        visits, wins = [self.visits[new_root]], [self.wins[new_root]]
+        queue = [(new_root, 0)]
+        for old, new in queue:
+            first, count = self.first_child[old], self.child_count[old]
+            if count == 0:
+                continue
+            first_child[new] = len(visits)
+            child_count[new] = count
+            for child in range(first, first + count):
+                queue.append((child, len(visits)))
+                parent.append(new)
+                move.append(self.move[child])
+                mover.append(self.mover[child])
+                first_child.append(0)
+                child_count.append(0)
+                visits.append(self.visits[child])
+                wins.append(self.wins[child])
+        self.parent, self.move, self.mover = parent, move, mover
+        self.first_child, self.child_count = first_child, child_count
+        self.visits, self.wins = visits, wins
+
+    def _iterate(self, game):
+        visits, wins, child_count, first_child = self.visits, self.wins, self.child_count, self.first_child
+        node = 0
+        path = []
+
+        # 1. Selection theo UCT
+        while child_count[node] and not game.is_over():
+            first = first_child[node]
+            log_n = math.log(visits[node])
+            best, best_value = first, -1.0
+            for child in range(first, first + child_count[node]):
+                n = visits[child]
+                if n == 0:
+                    best = child
+                    break
+                value = wins[child] / n + self.exploration * math.sqrt(log_n / n)
+                if value > best_value:
+                    best, best_value = child, value
+            node = best
+            game.make_move(self.move[node])
+            game.switch_player()
+            path.append(node)
+
+        # 2. Expansion: tạo tất cả con một lần, đi tiếp vào con đầu tiên
+        if not game.is_over() and (visits[node] or node == 0) and len(visits) < self.max_nodes:
+            moves = game.candidate_moves() if hasattr(game, 'candidate_moves') else game.possible_moves()
+            self.rng.shuffle(moves)
+            first_child[node] = len(visits)
+            child_count[node] = len(moves)
+            mover = game.current_player
+            for move in moves:
+                self.parent.append(node)
+                self.move.append(move)
+                self.mover.append(mover)
+                first_child.append(0)
+                child_count.append(0)
+                visits.append(0)
+                wins.append(0.0)
+            node = first_child[node]
+            game.make_move(self.move[node])
+            game.switch_player()
+            path.append(node)
+
+        # 3. Một lô rollout ngẫu nhiên từ lá
+        batch = self.rollouts_per_leaf if not game.is_over() else 1
+        scores = self._rollouts(game, batch)  # điểm cho X và cho O
+
+        # 4. Backpropagation
+        visits[0] += batch
+        for visited in path:
+            visits[visited] += batch
+            wins[visited] += scores[self.mover[visited]]
+
+        for visited in reversed(path):
+            game.switch_player()
+            game.unmake_move(self.move[visited])
+
+    def _rollouts(self, game, batch):
+        """Chơi ngẫu nhiên `batch` ván từ thế cờ hiện tại; trả về điểm [_, X, O]"""
+        scores = [0.0, 0.0, 0.0]
+        shuffle = self.rng.shuffle
+        for _ in range(batch):
+            played = []
+            # Các ô trống chỉ bị dùng dần, nên xáo trộn một lần rồi đi lần lượt là đủ
+            moves = game.possible_moves()
+            shuffle(moves)
+            for move in moves:
+                if game.is_over():
+                    break
+                game.make_move(move)
+                game.switch_player()
+                played.append(move)
+            winner = game.check_winner()
+            if winner:
+                scores[winner] += 1.0
+            else:
+                scores[1] += 0.5
+                scores[2] += 0.5
+            for move in reversed(played):
+                game.switch_player()
+                game.unmake_move(move)
+        return scores
@@ -0,0 +1,268 @@
+"""
+Trò chơi m,n,k (bàn m x n, k quân liên tiếp để thắng), ví dụ Gomoku 15x15 k=5.
+
+Mỗi "cửa sổ" là k ô liên tiếp trên một hàng, cột hoặc đường chéo. Bàn cờ giữ
+số quân X/O trong từng cửa sổ và cập nhật khi đi/hoàn tác một nước, nên:
+- phát hiện thắng chỉ xét các cửa sổ đi qua nước vừa đi,
+- điểm đe dọa (threat) của cả bàn cờ được cập nhật tăng dần, đọc trong O(1).
+"""
+
+import functools
+import time
+
+from easyAI import TwoPlayerGame
+
+WIN_SCORE = 10 ** 9
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@functools.lru_cache(maxsize=None)
+def _windows(m, n, k):
+    """(danh sách cửa sổ, các cửa sổ đi qua từng ô) cho bàn m x n"""
+    windows = []
+    for r in range(m):
+        for c in range(n):
+            for dr, dc in DIRECTIONS:
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < m and 0 <= end_c < n:
+                    windows.append(tuple((r + dr * t) * n + c + dc * t for t in range(k)))
+    cell_windows = [[] for _ in range(m * n)]
+    for w, cells in enumerate(windows):
+        for cell in cells:
+            cell_windows[cell].append(w)
+    return windows, tuple(tuple(ws) for ws in cell_windows)
+
+
+@functools.lru_cache(maxsize=None)
+def _contributions(k):
+    """
+    contrib[x][o]: điểm của một cửa sổ có x quân X và o quân O (theo góc nhìn X).
+    Cửa sổ có cả hai màu không còn là đe dọa; mỗi quân thêm vào nhân điểm lên 10.
+    """
+    contrib = [[0] * (k + 1) for _ in range(k + 1)]
+    for count in range(1, k + 1):
+        contrib[count][0] = 10 ** count
+        contrib[0][count] = -10 ** count
+    return contrib
+
+
+class MNKGame(TwoPlayerGame):
+    def __init__(self, players, m=15, n=15, k=5):
+        self.players = players
+        self.current_player = 1
+        self.m, self.n, self.k = m, n, k
+        self.board = [0] * (m * n)  # 0 = trống, 1 = X, 2 = O; ô (i, j) là chỉ số i*n + j
+        self.history = []
+        self.winner = 0
+        self.score = 0  # tổng điểm đe dọa theo góc nhìn X
+        self.windows, self.cell_windows = _windows(m, n, k)
+        self.counts = [[0] * len(self.windows), [0] * len(self.windows), [0] * len(self.windows)]
+        self.contrib = _contributions(k)
+        # Bán kính lân cận khi sinh nước đi cho engine: bàn nhỏ xét hết, bàn lớn chỉ xét sát quân
+        self.radius = 2 if max(m, n) <= 5 else 1
+
+    def possible_moves(self):
+        return [i for i, cell in enumerate(self.board) if cell == 0]
+
+    def candidate_moves(self):
+        """Các ô trống trong bán kính self.radius quanh các quân đã đặt"""
+        if not self.history:
+            return [(self.m // 2) * self.n + self.n // 2]
+        m, n, radius, board = self.m, self.n, self.radius, self.board
+        moves = set()
+        for move in self.history:
+            r, c = divmod(move, n)
+            for i in range(max(0, r - radius), min(m, r + radius + 1)):
+                for j in range(max(0, c - radius), min(n, c + radius + 1)):
+                    if board[i * n + j] == 0:
+                        moves.add(i * n + j)
+        return list(moves)
+
+    def make_move(self, move):
+        player = self.current_player
+        own = self.counts[player]
+        contrib = self.contrib
+        x_counts, o_counts = self.counts[1], self.counts[2]
+        delta = 0
+        for w in self.cell_windows[move]:
+            before = contrib[x_counts[w]][o_counts[w]]
+            own[w] += 1
+            delta += contrib[x_counts[w]][o_counts[w]] - before
+            if own[w] == self.k:
+                self.winner = player
+        self.score += delta
+        self.board[move] = player
+        self.history.append(move)
+
+    def unmake_move(self, move):
+        player = self.board[move]
+        own = self.counts[player]
+        contrib = self.contrib
+        x_counts, o_counts = self.counts[1], self.counts[2]
+        delta = 0
+        for w in self.cell_windows[move]:
+            before = contrib[x_counts[w]][o_counts[w]]
+            own[w] -= 1
+            delta += contrib[x_counts[w]][o_counts[w]] - before
+        self.score += delta
+        self.board[move] = 0
+        self.history.pop()
+        self.winner = 0  # như TicTacToe.unmake_move
+
+    def check_winner(self):
+        return self.winner
+
+    def is_full(self):
+        return len(self.history) == self.m * self.n
+
+    def lose(self):
+        return self.winner == 3 - self.current_player
+
+    def is_over(self):
+        return self.winner != 0 or self.is_full()
+
+    def scoring(self):
+        """Điểm đe dọa theo góc nhìn người chơi hiện tại"""
+        if self.winner:
+            return WIN_SCORE if self.winner == self.current_player else -WIN_SCORE
+        return self.score if self.current_player == 1 else -self.score
+
+    def move_label(self, move):
+        """Chỉ số ô -> 'hàng,cột' như TicTacToe.move_label"""
+        return f"{move // self.n},{move % self.n}"
+
+    def show(self):
+        symbols = {0: '.', 1: 'X', 2: 'O'}
+        width = len(str(max(self.m, self.n) - 1))
+        print()
+        print(" " * (width + 1) + " ".join(f"{j:>{width}}" for j in range(self.n)))
+        for i in range(self.m):
+            cells = " ".join(f"{symbols[self.board[i * self.n + j]]:>{width}}" for j in range(self.n))
+            print(f"{i:>{width}} {cells}")
+        print()
+
+    def ask_player(self, player):
+        """Đọc nước đi dạng 'hàng,cột' và trả về chỉ số ô"""
+        self.show()
+        while True:
+            try:
+                move_str = input(f"Player {player} ({'X' if player == 1 else 'O'}), nhập nước đi (hàng,cột): ")
+                i, j = map(int, move_str.replace(',', ' ').split())
+                if 0 <= i < self.m and 0 <= j < self.n and self.board[i * self.n + j] == 0:
+                    return i * self.n + j
+                print("Nước đi không hợp lệ! Vui lòng chọn ô trống.")
+            except ValueError:
+                print("Format không đúng! Vui lòng nhập theo format 'hàng,cột' (ví dụ: 7,7)")
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class AlphaBeta:
+    """
+    Negamax alpha-beta với iterative deepening trong giới hạn thời gian.
+
+    Thứ tự nước đi: nước tốt nhất của vòng lặp trước, killer move theo từng
+    tầng, rồi history heuristic. Dùng được như thuật toán AI của easyAI:
+
+        >>> game = MNKGame([Human_Player(), AI_Player(AlphaBeta(time_limit=1.0))])
+
+    Sau mỗi lần gọi, depth/nodes/score/elapsed mô tả lần tìm kiếm vừa xong.
+    Chỉ dùng giao diện chung của game (winner, is_over(), possible_moves(),
+    make_move/unmake_move, scoring()) nên chạy được cả với TicTacToe;
+    candidate_moves() được dùng nếu game có.
+    """
+
+    def __init__(self, time_limit=1.0, max_depth=64):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.history = {}
+        self.depth = 0
+        self.nodes = 0
+        self.score = 0
+        self.elapsed = 0.0
+
+    def __call__(self, game):
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit
+        self.nodes = 0
+        self.killers = [[None, None] for _ in range(self.max_depth + 1)]
+        # Giảm dần history cũ để thông tin từ các nước trước không lấn át
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+
+        moves = self._ordered_moves(game, 0)
+        best_move = moves[0]
+        self.depth = 0
+        self.score = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(game, moves, depth)
+            except SearchTimeout:
+                break
+            best_move, self.score, self.depth = move, score, depth
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - self.max_depth or depth >= len(game.possible_moves()):
+                break  # đã biết kết quả chắc chắn hoặc đã tìm hết cây
+        self.elapsed = time.perf_counter() - start
+        return best_move
+
+    def _ordered_moves(self, game, ply):
+        moves = game.candidate_moves() if hasattr(game, 'candidate_moves') else game.possible_moves()
+        history = self.history
+        moves.sort(key=lambda move: history.get(move, 0), reverse=True)
+        for killer in reversed(self.killers[ply]):
+            if killer in moves:
+                moves.remove(killer)
+                moves.insert(0, killer)
+        return moves
+
+    def _search_root(self, game, moves, depth):
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move = moves[0]
+        for move in moves:
+            game.make_move(move)
+            game.switch_player()
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            finally:
+                game.switch_player()
+                game.unmake_move(move)
+            if score > alpha:
+                alpha, best_move = score, move
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+        if game.winner:
+            return -(WIN_SCORE - ply)  # người vừa đi đã thắng; thua càng muộn càng tốt
+        if game.is_over():
+            return 0  # hết ô mà chưa ai thắng
+        if depth == 0 or ply >= self.max_depth:
+            return game.scoring()
+
+        best = -WIN_SCORE - 1
+        for move in self._ordered_moves(game, ply):
+            game.make_move(move)
+            game.switch_player()
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.switch_player()
+                game.unmake_move(move)
+            if score > best:
+                best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    killers = self.killers[ply]
+                    if killers[0] != move:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                    self.history[move] = self.history.get(move, 0) + depth * depth
+                    break
+        return best
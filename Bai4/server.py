@@ -0,0 +1,301 @@
+"""
+Server Tic Tac Toe nhiều ván cùng lúc (người vs AI) qua TCP.
+
+Mỗi kết nối là một ván riêng, giao tiếp bằng từng dòng văn bản:
+    hàng,cột   đi một nước (ví dụ 1,1)
+    new        ván mới
+    stats      số liệu của server
+    quit       thoát
+
+Nước đi của AI được tính trong ProcessPoolExecutor nên event loop không bị
+chặn và số ván phục vụ được tăng theo số lõi. Kết quả được lưu trong một
+cache dùng chung cho mọi ván, khóa bằng hash Zobrist của thế cờ: các thế cờ
+đã gặp ở bất kỳ ván nào được trả lời ngay mà không gửi sang tiến trình con.
+
+Ví dụ:
+    python server.py --port 9009 --engine negamax-tt:9
+    nc 127.0.0.1 9009
+    python server.py --load-test 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import collections
+import functools
+import logging
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from main import TicTacToe
+from tournament import engine_score, make_engine
+
+log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_engine(engine_spec):
+    """Mỗi tiến trình con giữ engine (và bảng chuyển vị của nó) qua nhiều lần gọi"""
+    return make_engine(engine_spec)
+
+
+def compute_move(state, engine_spec):
+    """Tính nước đi cho thế cờ state = ttentry() (chạy trong tiến trình con)"""
+    game = TicTacToe([None, None])
+    game.ttrestore(state)
+    engine = _worker_engine(engine_spec)
+    move = engine(game)
+    return move, engine_score(engine)
+
+
+class MoveCache:
+    """
+    Cache (nước đi, điểm) dùng chung cho mọi ván, khóa bằng hash Zobrist.
+    Mỗi mục giữ thêm ttentry() để một va chạm hash (rất hiếm) chỉ thành cache miss.
+    """
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, game):
+        entry = self.entries.get(game.hash)
+        if entry is not None and entry[0] == game.ttentry():
+            self.entries.move_to_end(game.hash)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, game, result):
+        self.entries[game.hash] = (game.ttentry(), result)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+class GameServer:
+    def __init__(self, engine_spec='negamax-tt:9', workers=None):
+        self.engine_spec = engine_spec
+        # Tiến trình con được tạo lúc có phiên đang mở; với fork chúng sẽ giữ socket của
+        # client và client không nhận được EOF khi phiên đóng, nên dùng forkserver nếu có
+        context = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(context))
+        self.cache = MoveCache()
+        self.in_flight = {}
+        self.sessions = 0
+        self.active = 0
+        self.games = 0
+        self.ai_latencies = collections.deque(maxlen=10000)
+        self.all_closed = asyncio.Event()  # được set khi không còn phiên nào mở
+        self.all_closed.set()
+
+    async def ai_move(self, game):
+        """Nước đi của AI: cache -> lời gọi đang chạy cho cùng thế cờ -> tiến trình con"""
+        start = time.perf_counter()
+        result = self.cache.get(game)
+        if result is None:
+            # Cùng khóa với MoveCache: hash Zobrist, kèm ttentry() để phát hiện va chạm
+            key, entry = game.hash, game.ttentry()
+            pending = self.in_flight.get(key)
+            if pending is not None and pending[0] == entry:
+                result = await asyncio.shield(pending[1])
+            else:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self.pool, compute_move, entry, self.engine_spec)
+                owner = pending is None  # va chạm hash: tính riêng, không chiếm chỗ
+                if owner:
+                    self.in_flight[key] = (entry, future)
+                try:
+                    result = await future
+                finally:
+                    if owner:
+                        del self.in_flight[key]
+                self.cache.put(game, result)
+        self.ai_latencies.append(time.perf_counter() - start)
+        return result[0]
+
+    def stats(self):
+        latencies = sorted(self.ai_latencies)
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q / 100 * len(latencies)))]
+
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            'sessions': self.sessions,
+            'active': self.active,
+            'games': self.games,
+            'queue_depth': len(self.in_flight),
+            'cache_size': len(self.cache.entries),
+            'cache_hit_rate': self.cache.hits / lookups if lookups else 0.0,
+            'ai_move_p50_ms': percentile(50) * 1000,
+            'ai_move_p95_ms': percentile(95) * 1000,
+            'ai_move_p99_ms': percentile(99) * 1000,
+        }
+
+    async def session(self, reader, writer):
+        self.sessions += 1
+        self.active += 1
+        self.all_closed.clear()
+
+        async def send(text):
+            writer.write((text + "\n").encode())
+            await writer.drain()
+
+        game = TicTacToe([None, None])
+        try:
+            await send("Chào mừng! Bạn là X, AI là O. Nhập nước đi dạng 'hàng,cột' "
+                       "(new = ván mới, stats = số liệu, quit = thoát)")
+            await send(game.render())
+            while line := await reader.readline():
+                command = line.decode().strip().lower()
+                if command == 'quit':
+                    break
+                if command == 'new':
+                    game = TicTacToe([None, None])
+                    await send(game.render())
+                    continue
+                if command == 'stats':
+                    await send(" ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                                        for key, value in self.stats().items()))
+                    continue
+                if game.is_over():
+                    await send("Ván đã kết thúc, gõ 'new' để chơi tiếp")
+                    continue
+                move = parse_move(command, game)
+                if move is None:
+                    await send(f"Nước đi không hợp lệ! Các nước đi hợp lệ: {' '.join(game.format_moves())}")
+                    continue
+
+                game.make_move(move)
+                game.switch_player()
+                if not game.is_over():
+                    ai_move = await self.ai_move(game)
+                    game.make_move(ai_move)
+                    game.switch_player()
+                    await send(f"AI đi: {game.move_label(ai_move)}")
+                await send(game.render())
+                if game.is_over():
+                    self.games += 1
+                    await send(result_message(game.check_winner()))
+        except ConnectionError:
+            pass
+        except Exception:
+            # Lỗi của engine hoặc tiến trình con: ghi log, báo cho client rồi đóng phiên
+            log.exception("Lỗi trong phiên chơi")
+            try:
+                await send("Lỗi server, phiên chơi kết thúc")
+            except ConnectionError:
+                pass
+        finally:
+            self.active -= 1
+            if not self.active:
+                self.all_closed.set()
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown()
+
+
+def parse_move(command, game):
+    """'hàng,cột' -> chỉ số ô nếu hợp lệ, ngược lại None"""
+    try:
+        i, j = map(int, command.replace(',', ' ').split())
+    except ValueError:
+        return None
+    move = i * 3 + j
+    if 0 <= i < 3 and 0 <= j < 3 and move in game.possible_moves():
+        return move
+    return None
+
+
+def result_message(winner):
+    if winner == 1:
+        return "Chúc mừng! Bạn đã thắng!"
+    if winner == 2:
+        return "AI thắng! Chúc bạn may mắn lần sau!"
+    return "Trò chơi hòa!"
+
+
+async def serve(server, host, port):
+    tcp_server = await asyncio.start_server(server.session, host, port)
+    print(f"Server Tic Tac Toe đang chạy tại {host}:{port} (engine {server.engine_spec})")
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+async def load_test(server, games, concurrency, seed=0):
+    """Chạy `games` ván với người chơi ngẫu nhiên, tối đa `concurrency` ván cùng lúc"""
+    tcp_server = await asyncio.start_server(server.session, '127.0.0.1', 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    semaphore = asyncio.Semaphore(concurrency)
+    move_latencies = []
+
+    async def client(index):
+        rng = random.Random(seed + index)
+        async with semaphore:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            shadow = TicTacToe([None, None])  # bản sao phía client để biết ô nào còn trống
+            while not shadow.is_over():
+                move = rng.choice(shadow.possible_moves())
+                start = time.perf_counter()
+                writer.write(f"{move // 3},{move % 3}\n".encode())
+                shadow.make_move(move)
+                shadow.switch_player()
+                if not shadow.is_over():
+                    line = await reader.readline()
+                    while not line.startswith("AI đi".encode()):
+                        line = await reader.readline()
+                    i, j = map(int, line.decode().split(":")[1].split(","))
+                    shadow.make_move(i * 3 + j)
+                    shadow.switch_player()
+                move_latencies.append(time.perf_counter() - start)
+            writer.write(b"quit\n")
+            await writer.drain()
+            writer.close()
+
+    start = time.perf_counter()
+    async with tcp_server:
+        await asyncio.gather(*(client(i) for i in range(games)))
+        await server.all_closed.wait()  # số liệu chỉ đầy đủ khi mọi phiên đã đóng
+    elapsed = time.perf_counter() - start
+
+    move_latencies.sort()
+    print(f"{games} ván, {concurrency} ván cùng lúc: {elapsed:.2f} giây ({games / elapsed:.1f} ván/giây)")
+    for q in (50, 95, 99):
+        value = move_latencies[min(len(move_latencies) - 1, int(q / 100 * len(move_latencies)))]
+        print(f"  độ trễ mỗi nước p{q}: {value * 1000:.2f} ms")
+    print("  " + " ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                          for key, value in server.stats().items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server Tic Tac Toe nhiều ván cùng lúc")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9009)
+    parser.add_argument('--engine', default='negamax-tt:9', help="engine của AI (xem tournament.py)")
+    parser.add_argument('--workers', type=int, help="số tiến trình tính nước đi (mặc định: số lõi)")
+    parser.add_argument('--load-test', type=int, metavar='GAMES',
+                        help="không mở server, chỉ chạy GAMES ván với người chơi ngẫu nhiên và in độ trễ")
+    parser.add_argument('--concurrency', type=int, default=50, help="số ván cùng lúc khi --load-test")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.engine, args.workers)
+    try:
+        if args.load_test:
+            asyncio.run(load_test(server, args.load_test, args.concurrency))
+        else:
+            asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
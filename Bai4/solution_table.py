@@ -0,0 +1,159 @@
+"""
+Bảng lời giải hoàn hảo cho Tic Tac Toe.
+
+Mọi thế cờ đến được từ bàn trống được chuẩn hóa theo 8 phép đối xứng của
+bàn cờ (765 thế cờ), giải bằng phân tích ngược từ nước cuối về bàn trống
+và lưu (giá trị, nước đi tốt nhất) cho từng thế cờ. Bảng được ghi ra đĩa
+để lần sau chỉ cần đọc lên; mỗi nước của AI chỉ còn là một lần tra dict.
+"""
+
+import os
+import struct
+
+from bitboard import FULL_BOARD, iter_bits, winner
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_solution.bin')
+MAGIC = b'TTT1'
+RECORD = struct.Struct('<Ibb')  # khóa chuẩn hóa, giá trị, nước đi (-1 nếu kết thúc)
+
+
+def _symmetries():
+    """8 hoán vị ô của nhóm đối xứng hình vuông: perm[ô gốc] = ô sau biến đổi"""
+    transforms = [
+        lambda i, j: (i, j),
+        lambda i, j: (j, 2 - i),
+        lambda i, j: (2 - i, 2 - j),
+        lambda i, j: (2 - j, i),
+        lambda i, j: (i, 2 - j),
+        lambda i, j: (2 - i, j),
+        lambda i, j: (j, i),
+        lambda i, j: (2 - j, 2 - i),
+    ]
+    perms = []
+    for transform in transforms:
+        perm = []
+        for cell in range(9):
+            i, j = transform(cell // 3, cell % 3)
+            perm.append(i * 3 + j)
+        perms.append(tuple(perm))
+    return perms
+
+
+SYMMETRIES = _symmetries()
+# MASK_MAPS[s][mask] = mask sau phép đối xứng s, tính sẵn cho cả 512 mask
+MASK_MAPS = [
+    [sum(1 << perm[cell] for cell in range(9) if mask >> cell & 1) for mask in range(512)]
+    for perm in SYMMETRIES
+]
+
+
+def canonical(x, o):
+    """Trả về (khóa chuẩn hóa, chỉ số phép đối xứng đưa thế cờ về khóa đó)"""
+    best_key, best_sym = None, 0
+    for sym, mapping in enumerate(MASK_MAPS):
+        key = (mapping[x] << 9) | mapping[o]
+        if best_key is None or key < best_key:
+            best_key, best_sym = key, sym
+    return best_key, best_sym
+
+
+def solve():
+    """
+    Phân tích ngược toàn bộ cây Tic Tac Toe.
+
+    Giá trị tính theo góc nhìn người đi tiếp: 0 = hòa, dương = thắng,
+    âm = thua; trị tuyệt đối là 10 - số nước khi ván kết thúc, nên thắng
+    nhanh và thua chậm được ưu tiên.
+    """
+    # Liệt kê các thế cờ đến được theo từng lớp số nước đã đi
+    layers = [{0: (0, 0)}]
+    for ply in range(9):
+        next_layer = {}
+        for x, o in layers[ply].values():
+            if winner(x, o):
+                continue
+            for move in iter_bits(FULL_BOARD & ~(x | o)):
+                child = (x | 1 << move, o) if ply % 2 == 0 else (x, o | 1 << move)
+                key, _ = canonical(*child)
+                # Lưu chính thế cờ chuẩn hóa để nước đi tốt nhất tính theo tọa độ của khóa
+                next_layer[key] = (key >> 9, key & FULL_BOARD)
+        layers.append(next_layer)
+
+    table = {}
+    for ply in range(9, -1, -1):
+        for key, (x, o) in layers[ply].items():
+            if winner(x, o):
+                table[key] = (-(10 - ply), -1)  # người vừa đi đã thắng
+                continue
+            if (x | o) == FULL_BOARD:
+                table[key] = (0, -1)
+                continue
+            best_value, best_move = None, -1
+            for move in iter_bits(FULL_BOARD & ~(x | o)):
+                child = (x | 1 << move, o) if ply % 2 == 0 else (x, o | 1 << move)
+                value = -table[canonical(*child)[0]][0]
+                if best_value is None or value > best_value:
+                    best_value, best_move = value, move
+            table[key] = (best_value, best_move)
+    return table
+
+
+class SolutionTable:
+    """
+    Bảng tra nước đi hoàn hảo, dùng được như một thuật toán AI của easyAI:
+
+        >>> table = SolutionTable.load_or_build()
+        >>> game = TicTacToe([Human_Player(), AI_Player(table)])
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.score = 0  # giá trị của thế cờ vừa tra, theo góc nhìn người đi
+
+    @classmethod
+    def build(cls):
+        return cls(solve())
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != MAGIC:
+            raise ValueError(f"{path} không phải bảng lời giải Tic Tac Toe")
+        entries = {key: (value, move) for key, value, move in RECORD.iter_unpack(data[4:])}
+        return cls(entries)
+
+    @classmethod
+    def load_or_build(cls, path=DEFAULT_PATH):
+        """Đọc bảng từ đĩa; nếu chưa có (hoặc hỏng) thì giải lại và ghi ra đĩa"""
+        try:
+            return cls.load(path)
+        except (OSError, ValueError, struct.error):
+            table = cls.build()
+            try:
+                table.save(path)
+            except OSError:
+                pass
+            return table
+
+    def save(self, path=DEFAULT_PATH):
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            for key in sorted(self.entries):
+                value, move = self.entries[key]
+                f.write(RECORD.pack(key, value, move))
+
+    def lookup(self, x, o):
+        """(giá trị, nước đi tốt nhất) cho thế cờ gốc; nước đi là -1 nếu ván đã kết thúc"""
+        key, sym = canonical(x, o)
+        value, move = self.entries[key]
+        if move >= 0:
+            move = SYMMETRIES[sym].index(move)
+        return value, move
+
+    def __call__(self, game):
+        self.score, move = self.lookup(game.masks[1], game.masks[2])
+        return move
+
+    def __len__(self):
+        return len(self.entries)
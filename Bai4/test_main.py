@@ -0,0 +1,26 @@
+import re
+
+from easyAI import AI_Player, Negamax
+
+from main import TicTacToe, play
+from mnk import AlphaBeta, MNKGame
+
+
+def _moves_printed(output):
+    return re.findall(r"plays (\S+) :", output)
+
+
+def test_play_prints_tictactoe_moves_as_row_col(capsys):
+    game = TicTacToe([AI_Player(Negamax(2)), AI_Player(Negamax(2))])
+    play(game)
+    moves = _moves_printed(capsys.readouterr().out)
+    assert moves
+    assert all(re.fullmatch(r"[0-2],[0-2]", move) for move in moves)
+
+
+def test_play_prints_gomoku_moves_as_row_col(capsys):
+    game = MNKGame([AI_Player(AlphaBeta(0.02)), AI_Player(AlphaBeta(0.02))], 7, 7, 4)
+    play(game)
+    moves = _moves_printed(capsys.readouterr().out)
+    assert moves[0] == "3,3"  # ô giữa là chỉ số 24 trên bitboard
+    assert all(re.fullmatch(r"[0-6],[0-6]", move) for move in moves)
@@ -0,0 +1,44 @@
+import asyncio
+
+from main import TicTacToe
+from server import GameServer, MoveCache
+
+
+def _game(*moves):
+    game = TicTacToe([None, None])
+    for move in moves:
+        game.make_move(move)
+        game.switch_player()
+    return game
+
+
+def test_move_cache_treats_hash_collisions_as_misses():
+    cache = MoveCache()
+    first, second = _game(0), _game(4)
+    second.hash = first.hash  # giả lập va chạm Zobrist
+    cache.put(first, (4, 0))
+    assert cache.get(first) == (4, 0)
+    assert cache.get(second) is None
+
+
+def test_engine_failure_gets_an_error_reply():
+    async def play():
+        server = GameServer('bogus-engine', workers=1)  # make_engine báo ValueError trong tiến trình con
+        tcp_server = await asyncio.start_server(server.session, '127.0.0.1', 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        try:
+            async with tcp_server:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(b"1,1\n")
+                lines = []
+                while line := await asyncio.wait_for(reader.readline(), 30):
+                    lines.append(line.decode())
+                writer.close()
+                await server.all_closed.wait()
+            return lines, server.active
+        finally:
+            server.close()
+
+    lines, active = asyncio.run(play())
+    assert lines[-1].startswith("Lỗi server")
+    assert active == 0
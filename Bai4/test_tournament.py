@@ -0,0 +1,29 @@
+from main import TicTacToe
+from tournament import RootParallel, make_engine, play_one
+
+
+def test_alphabeta_plays_tictactoe():
+    result = play_one(('tictactoe', 'alphabeta:0.1', 'negamax:9', 0, 0))
+    assert result['winner'] == 0  # hai engine hoàn hảo luôn hòa
+    assert result['nodes'][0] > 0
+
+
+def test_alphabeta_engine_answers_a_tictactoe_position():
+    game = TicTacToe([None, None])
+    for move in (0, 4, 1):
+        game.make_move(move)
+        game.switch_player()
+    assert make_engine('alphabeta:0.1')(game) == 2  # O phải chặn hàng trên
+
+
+def test_root_parallel_engine_spec():
+    game = TicTacToe([None, None])
+    for move in (0, 4, 1):
+        game.make_move(move)
+        game.switch_player()
+    engine = make_engine('root:negamax:6')
+    try:
+        assert isinstance(engine, RootParallel)
+        assert engine(game) == 2
+    finally:
+        engine.close()
@@ -0,0 +1,290 @@
+"""
+Chạy giải đấu AI vs AI không tương tác trên nhiều tiến trình.
+
+Engine được mô tả bằng chuỗi để gửi sang tiến trình con:
+    negamax:D        easyAI Negamax độ sâu D
+    negamax-tt:D     Negamax độ sâu D với bảng chuyển vị
+    table            bảng lời giải hoàn hảo (chỉ Tic Tac Toe)
+    alphabeta:T[:D]  AlphaBeta của mnk.py, T giây mỗi nước, độ sâu tối đa D
+    mcts[:MS]        MCTS của mcts.py, MS mili giây mỗi nước (mặc định 500)
+    root:SPEC        RootParallel: chia các nước ở tầng gốc cho các tiến trình,
+                     mỗi nước được tìm bằng engine SPEC (ví dụ root:alphabeta:0.5)
+    random           đi ngẫu nhiên
+Game: 'tictactoe' hoặc 'mnk:M,N,K' (ví dụ mnk:9,9,5).
+
+Ví dụ:
+    python tournament.py --engine-a negamax:9 --engine-b negamax:5 --games 1000 --opening 2
+    python tournament.py --game mnk:9,9,5 --engine-a root:alphabeta:0.5 --engine-b alphabeta:0.5 --workers 1
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from easyAI import Negamax
+from easyAI.AI import TranspositionTable
+
+from main import TicTacToe
+from mcts import MCTS
+from mnk import WIN_SCORE, AlphaBeta, MNKGame
+from solution_table import SolutionTable
+
+
+class CountingTicTacToe(TicTacToe):
+    """Đếm số lần make_move (số node mà engine đã duyệt)"""
+    nodes = 0
+
+    def make_move(self, move):
+        self.nodes += 1
+        super().make_move(move)
+
+
+class CountingMNKGame(MNKGame):
+    nodes = 0
+
+    def make_move(self, move):
+        self.nodes += 1
+        super().make_move(move)
+
+
+def new_game(game_spec):
+    if game_spec == 'tictactoe':
+        return CountingTicTacToe([None, None])
+    if game_spec.startswith('mnk:'):
+        m, n, k = map(int, game_spec[4:].split(','))
+        return CountingMNKGame([None, None], m, n, k)
+    raise ValueError(f"Game không hợp lệ: {game_spec}")
+
+
+def game_state(game):
+    """Trạng thái gọn, gửi được sang tiến trình khác"""
+    if isinstance(game, MNKGame):
+        return tuple(game.history)
+    return game.ttentry()
+
+
+def restore_game(game_spec, state):
+    game = new_game(game_spec)
+    if isinstance(game, MNKGame):
+        for move in state:
+            game.make_move(move)
+            game.switch_player()
+        game.nodes = 0
+    else:
+        game.ttrestore(state)
+    return game
+
+
+@functools.lru_cache(maxsize=None)
+def _solution_table():
+    return SolutionTable.load_or_build()
+
+
+class RandomEngine:
+    def __init__(self, rng):
+        self.rng = rng
+
+    def __call__(self, game):
+        return self.rng.choice(game.possible_moves())
+
+
+def make_engine(spec, rng=random, game_spec='tictactoe'):
+    name, _, args = spec.partition(':')
+    params = args.split(':') if args else []
+    if name == 'negamax':
+        return Negamax(int(params[0]))
+    if name == 'negamax-tt':
+        return Negamax(int(params[0]), tt=TranspositionTable())
+    if name == 'table':
+        return _solution_table()
+    if name == 'alphabeta':
+        time_limit = float(params[0]) if params else 1.0
+        max_depth = int(params[1]) if len(params) > 1 else 64
+        return AlphaBeta(time_limit, max_depth)
+    if name == 'mcts':
+        return MCTS(int(params[0]) if params else 500, rng=rng)
+    if name == 'root' and args:
+        return RootParallel(args, game_spec)
+    if name == 'random':
+        return RandomEngine(rng)
+    raise ValueError(f"Engine không hợp lệ: {spec}")
+
+
+def engine_score(engine):
+    """Điểm của lần tìm kiếm vừa xong, theo góc nhìn người đi"""
+    if isinstance(engine, Negamax):
+        return engine.alpha
+    return getattr(engine, 'score', 0)
+
+
+def play_one(task):
+    """Chơi một ván, trả về dict kết quả (chạy trong tiến trình con)"""
+    game_spec, engine_x, engine_o, seed, opening = task
+    rng = random.Random(seed)
+    game = new_game(game_spec)
+    engines = [make_engine(engine_x, rng, game_spec), make_engine(engine_o, rng, game_spec)]
+    nodes = [0, 0]
+    think_time = [0.0, 0.0]
+
+    plies = 0
+    while not game.is_over():
+        player = game.current_player - 1
+        if plies < opening:
+            move = rng.choice(game.possible_moves())
+        else:
+            nodes_before = game.nodes
+            start = time.perf_counter()
+            move = engines[player](game)
+            think_time[player] += time.perf_counter() - start
+            nodes[player] += game.nodes - nodes_before
+            if isinstance(engines[player], RootParallel):
+                nodes[player] += engines[player].nodes  # duyệt trong các tiến trình con
+        game.make_move(move)
+        game.switch_player()
+        plies += 1
+    for engine in engines:
+        if isinstance(engine, RootParallel):
+            engine.close()
+
+    return {
+        'winner': game.check_winner(),
+        'plies': plies,
+        'nodes': nodes,
+        'time': think_time,
+    }
+
+
+def run_tournament(engine_a, engine_b, games=100, workers=None, game_spec='tictactoe',
+                   opening=0, seed=0):
+    """
+    Chơi `games` ván giữa engine_a và engine_b, đổi màu sau mỗi ván.
+    Hai ván của một cặp dùng chung seed (cùng các nước mở đầu ngẫu nhiên),
+    nên chênh lệch giữa hai engine không lẫn với độ may rủi của khai cuộc.
+    Kết quả thắng/hòa/thua tính theo góc nhìn engine_a.
+    """
+    tasks = []
+    for i in range(games):
+        if i % 2 == 0:
+            tasks.append((game_spec, engine_a, engine_b, seed + i // 2, opening))
+        else:
+            tasks.append((game_spec, engine_b, engine_a, seed + i // 2, opening))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(play_one, tasks, chunksize=max(1, games // (4 * (workers or os.cpu_count() or 1)))))
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        'game': game_spec,
+        'games': games,
+        'opening': opening,
+        'seed': seed,
+        'elapsed': elapsed,
+        'wins': 0,
+        'draws': 0,
+        'losses': 0,
+        'engines': {
+            'a': {'spec': engine_a, 'nodes': 0, 'time': 0.0},
+            'b': {'spec': engine_b, 'nodes': 0, 'time': 0.0},
+        },
+    }
+    for i, result in enumerate(results):
+        a_player = 1 if i % 2 == 0 else 2
+        sides = ('a', 'b') if a_player == 1 else ('b', 'a')
+        for side, nodes, think_time in zip(sides, result['nodes'], result['time']):
+            summary['engines'][side]['nodes'] += nodes
+            summary['engines'][side]['time'] += think_time
+        if result['winner'] == 0:
+            summary['draws'] += 1
+        elif result['winner'] == a_player:
+            summary['wins'] += 1
+        else:
+            summary['losses'] += 1
+    for stats in summary['engines'].values():
+        stats['nodes_per_second'] = stats['nodes'] / stats['time'] if stats['time'] else 0.0
+    return summary
+
+
+def _evaluate_root_move(task):
+    """Đánh giá một nước ở tầng gốc (chạy trong tiến trình con)"""
+    game_spec, state, move, engine_spec = task
+    game = restore_game(game_spec, state)
+    game.make_move(move)
+    game.switch_player()
+    if game.lose():
+        return move, WIN_SCORE, 0
+    if game.is_over():
+        return move, 0, 0
+    engine = make_engine(engine_spec)
+    engine(game)
+    return move, -engine_score(engine), game.nodes
+
+
+class RootParallel:
+    """
+    Chia các nước ở tầng gốc cho các tiến trình con, mỗi tiến trình tìm kiếm
+    thế cờ sau nước đó bằng engine_spec; chọn nước có điểm cao nhất.
+
+    Dùng được như thuật toán AI của easyAI. Với engine giới hạn thời gian
+    (alphabeta:T), T nên là thời gian cho mỗi nhóm nước chạy song song.
+    """
+
+    def __init__(self, engine_spec, game_spec, workers=None):
+        self.engine_spec = engine_spec
+        self.game_spec = game_spec
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.nodes = 0
+        self.score = 0
+        self.elapsed = 0.0
+
+    def __call__(self, game):
+        start = time.perf_counter()
+        state = game_state(game)
+        moves = game.candidate_moves() if hasattr(game, 'candidate_moves') else game.possible_moves()
+        tasks = [(self.game_spec, state, move, self.engine_spec) for move in moves]
+        results = list(self.pool.map(_evaluate_root_move, tasks))
+        best_move, self.score, _ = max(results, key=lambda result: result[1])
+        self.nodes = sum(result[2] for result in results)
+        self.elapsed = time.perf_counter() - start
+        return best_move
+
+    def close(self):
+        self.pool.shutdown()
+
+
+def print_summary(summary):
+    a, b = summary['engines']['a'], summary['engines']['b']
+    print(f"{a['spec']} vs {b['spec']} ({summary['game']}, {summary['games']} ván, "
+          f"{summary['opening']} nước mở đầu ngẫu nhiên)")
+    print(f"Thắng/Hòa/Thua: {summary['wins']}/{summary['draws']}/{summary['losses']}")
+    for side in (a, b):
+        print(f"  {side['spec']:<16} {side['nodes']:>12} nodes  {side['nodes_per_second']:>12,.0f} nodes/giây")
+    print(f"Tổng thời gian: {summary['elapsed']:.2f} giây")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Giải đấu AI vs AI cho Tic Tac Toe / m,n,k")
+    parser.add_argument('--engine-a', default='negamax:9')
+    parser.add_argument('--engine-b', default='negamax:5')
+    parser.add_argument('--game', default='tictactoe')
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--opening', type=int, default=0, help="số nước mở đầu ngẫu nhiên")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help="in kết quả dạng JSON")
+    args = parser.parse_args(argv)
+
+    summary = run_tournament(args.engine_a, args.engine_b, args.games, args.workers,
+                             args.game, args.opening, args.seed)
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
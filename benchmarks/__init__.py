@@ -0,0 +1,11 @@
+"""
+Shared benchmark and profiling harness for the four solver projects.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
+
+from .harness import run_workload, run_workloads
+from .loader import load_project
+from .workloads import WORKLOADS
+
+__all__ = ['WORKLOADS', 'load_project', 'run_workload', 'run_workloads']
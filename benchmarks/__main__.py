@@ -0,0 +1,58 @@
+import argparse
+import fnmatch
+import json
+import sys
+
+from .harness import PROFILERS, print_profile_summary, print_report, run_workloads
+from .loader import PROJECTS
+from .workloads import WORKLOADS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Benchmark and profile the Bai1-Bai4 solvers with one harness")
+    parser.add_argument('workloads', nargs='*',
+                        help="workload names or glob patterns (default: all)")
+    parser.add_argument('--project', action='append', choices=PROJECTS,
+                        help="only run workloads of this project")
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per workload")
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help="also run each workload under a profiler")
+    parser.add_argument('--profile-dir', default='profiles')
+    parser.add_argument('--top', type=int, default=0,
+                        help="print the N most expensive functions of each cProfile run")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--json', metavar='FILE', help="write the report as JSON ('-' for stdout)")
+    parser.add_argument('--list', action='store_true', help="list workloads and exit")
+    args = parser.parse_args(argv)
+
+    selected = [w for w in WORKLOADS.values()
+                if (not args.workloads or any(fnmatch.fnmatch(w.name, p) for p in args.workloads))
+                and (not args.project or w.project in args.project)]
+    if args.list:
+        for w in selected:
+            print(f"{w.name:<28} {w.description}")
+        return
+    if not selected:
+        parser.error("no workload matches")
+
+    reports = run_workloads(selected, args.repeat, args.profile, args.profile_dir,
+                            memory=not args.no_memory)
+    stream = sys.stderr if args.json == '-' else sys.stdout
+    print_report(reports, stream=stream)
+    if args.top:
+        for report in reports:
+            if report['profile']:
+                print(f"\n== {report['workload']} ==", file=stream)
+                print_profile_summary(report['profile'], args.top, stream=stream)
+    if args.json == '-':
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import contextlib
+import cProfile
+import io
+import math
+import os
+import pstats
+import random
+import statistics
+import time
+import tracemalloc
+
+from .loader import load_project
+
+PROFILERS = ('cprofile', 'sampling')
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile, q in [0, 100]; None for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _profile(run, repeat, profiler, path):
+    """Run the workload again under a profiler and write the output to `path`."""
+    if profiler == 'cprofile':
+        prof = cProfile.Profile()
+        prof.enable()
+        for seed in range(repeat):
+            run(seed)
+        prof.disable()
+        prof.dump_stats(path + '.prof')
+        return path + '.prof'
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        raise RuntimeError("the sampling profiler needs pyinstrument (pip install pyinstrument)")
+    prof = Profiler()
+    prof.start()
+    for seed in range(repeat):
+        run(seed)
+    prof.stop()
+    with open(path + '.txt', 'w') as f:
+        f.write(prof.output_text())
+    return path + '.txt'
+
+
+def run_workload(workload, repeat=20, profiler=None, profile_dir='profiles', memory=True):
+    """Time `repeat` seeded runs of one workload and return a report dict."""
+    module = load_project(workload.project)
+    run = workload.setup(module)
+
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        run(0)  # warm-up: imports, lazily built tables, caches
+
+        latencies = []
+        for seed in range(repeat):
+            random.seed(seed)
+            start = time.perf_counter()
+            run(seed)
+            latencies.append(time.perf_counter() - start)
+
+        peak = None
+        if memory:
+            random.seed(0)
+            tracemalloc.start()
+            run(0)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        profile_path = None
+        if profiler:
+            os.makedirs(profile_dir, exist_ok=True)
+            profile_path = _profile(run, repeat, profiler, os.path.join(profile_dir, workload.name))
+
+    total = sum(latencies)
+    return {
+        'workload': workload.name,
+        'project': workload.project,
+        'description': workload.description,
+        'runs': repeat,
+        'total_time': total,
+        'throughput': repeat / total if total else 0.0,
+        'mean': statistics.mean(latencies),
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': max(latencies),
+        'peak_memory_kb': peak / 1024 if peak is not None else None,
+        'profile': profile_path,
+    }
+
+
+def run_workloads(workloads, repeat=20, profiler=None, profile_dir='profiles', memory=True):
+    return [run_workload(w, repeat, profiler, profile_dir, memory) for w in workloads]
+
+
+def print_report(reports, stream=None):
+    print(f"{'workload':<28} {'runs/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} "
+          f"{'peak KB':>10}", file=stream)
+    print("-" * 83, file=stream)
+    for r in reports:
+        peak = f"{r['peak_memory_kb']:.0f}" if r['peak_memory_kb'] is not None else "-"
+        print(f"{r['workload']:<28} {r['throughput']:>10.1f} {r['p50'] * 1000:>10.3f} "
+              f"{r['p95'] * 1000:>10.3f} {r['p99'] * 1000:>10.3f} {peak:>10}", file=stream)
+
+
+def print_profile_summary(path, limit=15, stream=None):
+    if path.endswith('.prof'):
+        pstats.Stats(path, stream=stream).sort_stats('cumulative').print_stats(limit)
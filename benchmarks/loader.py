@@ -0,0 +1,34 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECTS = ('Bai1', 'Bai2', 'Bai3', 'Bai4')
+
+
+def load_project(project):
+    """
+    Import ``<project>/main.py`` as a library module named ``<project>_main``.
+
+    Every project calls its entry point ``main.py``, so they cannot be
+    imported side by side by name. The project directory is put on
+    ``sys.path`` so its sibling modules (annealing, bitboard, ...) resolve.
+    """
+    name = f"{project.lower()}_main"
+    if name in sys.modules:
+        return sys.modules[name]
+    if project not in PROJECTS:
+        raise ValueError(f"Unknown project: {project}")
+
+    directory = os.path.join(ROOT, project)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(directory, 'main.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
@@ -0,0 +1,86 @@
+"""
+Startup budget for the solver entry points.
+
+``python -m benchmarks.startup`` imports each project's ``main`` in a fresh
+interpreter under ``python -X importtime`` and fails (exit status 1) if the
+cumulative import time of ``main`` is over budget, or if a dependency that
+only some menu paths need was imported eagerly. The same checks run as
+``benchmarks/test_startup.py`` under pytest.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from .loader import PROJECTS, ROOT
+
+# Milliseconds for ``import main``, best of several runs, including site-packages.
+# Roughly three times the measured 7-16 ms, so machine load does not fail an
+# unchanged tree; LAZY_MODULES is the strict check (numpy, which Bai4 used to
+# import, costs ~100 ms on its own).
+BUDGET_MS = 50
+BUDGETS_MS = {project: BUDGET_MS for project in PROJECTS}
+
+# Modules that must not be loaded by ``import main``; they belong to a solver path
+LAZY_MODULES = {
+    'Bai1': ('bounded_search',),
+    'Bai2': ('bounded_search', 'dlx'),
+    'Bai3': ('argparse',),
+    'Bai4': ('numpy', 'mcts', 'mnk', 'solution_table'),
+}
+
+_PROBE = "import main, sys; print(' '.join(sys.modules))"
+
+
+def measure_startup(project, runs=5):
+    """(best cumulative import time of main in ms, set of loaded module names)"""
+    best, loaded = None, set()
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', _PROBE],
+                              cwd=os.path.join(ROOT, project),
+                              capture_output=True, text=True, check=True)
+        for line in proc.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == 'main':
+                elapsed = int(fields[1]) / 1000
+                best = elapsed if best is None else min(best, elapsed)
+        loaded = set(proc.stdout.split())
+    return best, loaded
+
+
+def check_startup(projects=PROJECTS, runs=5):
+    """Return a list of report dicts, one per project"""
+    reports = []
+    for project in projects:
+        elapsed, loaded = measure_startup(project, runs)
+        eager = sorted(name for name in LAZY_MODULES[project] if name in loaded)
+        reports.append({
+            'project': project,
+            'import_ms': elapsed,
+            'budget_ms': BUDGETS_MS[project],
+            'eager_imports': eager,
+            'ok': elapsed <= BUDGETS_MS[project] and not eager,
+        })
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup',
+                                     description="Check the import-time budget of each main.py")
+    parser.add_argument('--project', action='append', choices=PROJECTS)
+    parser.add_argument('--runs', type=int, default=5, help="interpreter launches per project")
+    args = parser.parse_args(argv)
+
+    reports = check_startup(args.project or PROJECTS, args.runs)
+    print(f"{'project':<8} {'import ms':>10} {'budget ms':>10}  status")
+    for r in reports:
+        status = "ok" if r['ok'] else "FAIL"
+        if r['eager_imports']:
+            status += f" (eagerly imports {', '.join(r['eager_imports'])})"
+        print(f"{r['project']:<8} {r['import_ms']:>10.1f} {r['budget_ms']:>10}  {status}")
+    return 0 if all(r['ok'] for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
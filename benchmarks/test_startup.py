@@ -0,0 +1,19 @@
+import pytest
+
+from .loader import PROJECTS
+from .startup import BUDGETS_MS, LAZY_MODULES, measure_startup
+
+
+@pytest.fixture(scope='module', params=PROJECTS)
+def startup(request):
+    return request.param, measure_startup(request.param, runs=3)
+
+
+def test_no_eager_solver_imports(startup):
+    project, (_, loaded) = startup
+    assert sorted(name for name in LAZY_MODULES[project] if name in loaded) == []
+
+
+def test_import_time_within_budget(startup):
+    project, (elapsed, _) = startup
+    assert elapsed <= BUDGETS_MS[project]
@@ -0,0 +1,180 @@
+"""
+Curated workloads, one or more per solver.
+
+A workload's ``setup(module)`` receives the project's ``main`` module and
+returns ``run(seed)``, the callable that is timed. Everything expensive that
+is not part of the solver itself (building instances, loading tables) belongs
+in ``setup``.
+"""
+
+import random
+from collections import namedtuple
+
+Workload = namedtuple('Workload', 'name project description setup')
+
+WORKLOADS = {}
+
+
+def workload(name, project, description):
+    def register(setup):
+        WORKLOADS[name] = Workload(name, project, description, setup)
+        return setup
+    return register
+
+
+# --- Bai1: 8-puzzle -----------------------------------------------------------
+
+def _scrambled_puzzle(module, moves, seed):
+    """A solvable instance: `moves` random moves away from the goal state."""
+    problem = module.EightPuzzleProblem()
+    rng = random.Random(seed)
+    state = problem.goal_state
+    for _ in range(moves):
+        state = problem.result(state, rng.choice(problem.actions(state)))
+    return state
+
+
+@workload('bai1.astar.default', 'Bai1', "A* on the built-in 8-puzzle instance")
+def _bai1_astar_default(module):
+    from simpleai.search import astar
+    return lambda seed: astar(module.EightPuzzleProblem())
+
+
+@workload('bai1.astar.scrambled', 'Bai1', "A* on an instance 40 random moves from the goal")
+def _bai1_astar_scrambled(module):
+    from simpleai.search import astar
+    initial = _scrambled_puzzle(module, 40, seed=3)
+    return lambda seed: astar(module.EightPuzzleProblem(initial), graph_search=True)
+
+
+@workload('bai1.greedy.scrambled', 'Bai1', "Greedy search on the same scrambled instance")
+def _bai1_greedy_scrambled(module):
+    from simpleai.search import greedy
+    initial = _scrambled_puzzle(module, 40, seed=3)
+    return lambda seed: greedy(module.EightPuzzleProblem(initial), graph_search=True)
+
+
+@workload('bai1.sma.scrambled', 'Bai1', "SMA* with a 500-node budget on the scrambled instance")
+def _bai1_sma_scrambled(module):
+    from bounded_search import sma_star
+    initial = _scrambled_puzzle(module, 40, seed=3)
+    return lambda seed: sma_star(module.EightPuzzleProblem(initial), max_nodes=500)
+
+
+@workload('bai1.beam.scrambled', 'Bai1', "Beam search, width 100, on the scrambled instance")
+def _bai1_beam_scrambled(module):
+    from bounded_search import beam_search
+    initial = _scrambled_puzzle(module, 40, seed=3)
+    return lambda seed: beam_search(module.EightPuzzleProblem(initial), beam_width=100)
+
+
+# --- Bai2: incremental 8 queens ---------------------------------------------
+
+@workload('bai2.astar.first', 'Bai2', "A* to the first 8-queens solution")
+def _bai2_astar(module):
+    from simpleai.search import astar
+    return lambda seed: astar(module.EightQueensProblem())
+
+
+@workload('bai2.greedy.first', 'Bai2', "Greedy search to the first 8-queens solution")
+def _bai2_greedy(module):
+    from simpleai.search import greedy
+    return lambda seed: greedy(module.EightQueensProblem())
+
+
+@workload('bai2.sma.first', 'Bai2', "SMA* with a 5000-node budget to the first 8-queens solution")
+def _bai2_sma(module):
+    from bounded_search import sma_star
+    return lambda seed: sma_star(module.EightQueensProblem(), max_nodes=5000)
+
+
+@workload('bai2.enumerate.all', 'Bai2', "Enumerate all 92 solutions through actions()/result()")
+def _bai2_enumerate(module):
+    def run(seed):
+        problem = module.EightQueensProblem()
+        stack = [problem.initial_state]
+        solutions = 0
+        while stack:
+            state = stack.pop()
+            if problem.is_goal(state):
+                solutions += 1
+                continue
+            for action in problem.actions(state):
+                stack.append(problem.result(state, action))
+        return solutions
+    return run
+
+
+@workload('bai2.dlx.all', 'Bai2', "Dancing Links: all 92 solutions")
+def _bai2_dlx(module):
+    from dlx import queens_cover
+    return lambda seed: queens_cover(8).count()
+
+
+@workload('bai2.dlx.n10', 'Bai2', "Dancing Links: all 724 solutions of 10 queens")
+def _bai2_dlx_n10(module):
+    from dlx import queens_cover
+    return lambda seed: queens_cover(10).count()
+
+
+# --- Bai3: local search 8 queens -------------------------------------------
+
+def _bai3_solve(algorithm, **kwargs):
+    def setup(module):
+        return lambda seed: module.solve(algorithm, seed=seed, **kwargs)
+    return setup
+
+
+for _algorithm, _description in (
+        ('hill_climbing', "simpleai hill climbing from a random state"),
+        ('simulated_annealing', "simpleai simulated annealing, 10000 iterations"),
+        ('genetic', "Bai3 genetic algorithm, population 100"),
+        ('annealing', "in-project simulated annealing engine"),
+        ('steady_state', "steady-state GA on preallocated genome buffers, population 100")):
+    workload(f"bai3.{_algorithm}", 'Bai3', _description)(_bai3_solve(_algorithm))
+
+workload('bai3.genetic.permutation', 'Bai3', "Genetic algorithm on the permutation encoding")(
+    _bai3_solve('genetic', encoding='permutation'))
+workload('bai3.annealing.n1000', 'Bai3', "Annealing engine, N=1000, 100000 iterations")(
+    _bai3_solve('annealing', n=1000, budget=100000))
+
+
+# --- Bai4: tic-tac-toe and m,n,k ------------------------------------------
+
+@workload('bai4.negamax.opening', 'Bai4', "easyAI Negamax(9) first move on an empty board")
+def _bai4_negamax(module):
+    from easyAI import Negamax
+    return lambda seed: Negamax(9)(module.TicTacToe([None, None]))
+
+
+@workload('bai4.negamax_tt.opening', 'Bai4', "Negamax(9) with a fresh transposition table")
+def _bai4_negamax_tt(module):
+    from easyAI import Negamax
+    from easyAI.AI import TranspositionTable
+    return lambda seed: Negamax(9, tt=TranspositionTable())(module.TicTacToe([None, None]))
+
+
+@workload('bai4.table.game', 'Bai4', "A full self-play game using the solution table")
+def _bai4_table(module):
+    table = module.load_solution_table()
+
+    def run(seed):
+        game = module.TicTacToe([None, None])
+        while not game.is_over():
+            game.make_move(table(game))
+            game.switch_player()
+        return game.check_winner()
+    return run
+
+
+@workload('bai4.alphabeta.mnk', 'Bai4', "AlphaBeta depth 3 on a 9x9 k=5 middle game")
+def _bai4_alphabeta(module):
+    from mnk import AlphaBeta, MNKGame
+
+    def run(seed):
+        game = MNKGame([None, None], 9, 9, 5)
+        for move in (40, 41, 31, 50, 32):
+            game.make_move(move)
+            game.switch_player()
+        return AlphaBeta(time_limit=60, max_depth=3)(game)
+    return run
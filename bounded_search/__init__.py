@@ -0,0 +1,15 @@
+"""
+Memory-bounded search for any simpleai ``SearchProblem``.
+
+``sma_star`` and ``beam_search`` never hold more than a configured number of
+nodes, unlike simpleai's ``astar`` whose explored set grows without bound.
+When a budget is hit they return the node closest to the goal (lowest
+heuristic, or highest ``problem.progress(state)`` if the problem defines
+it) instead of failing, together with search statistics.
+"""
+
+from .beam import beam_search
+from .nodes import BoundedNode, BoundedResult
+from .sma import sma_star
+
+__all__ = ['BoundedNode', 'BoundedResult', 'beam_search', 'sma_star']
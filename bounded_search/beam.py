@@ -0,0 +1,58 @@
+import heapq
+import time
+
+from .nodes import BoundedResult, root_node
+
+
+def beam_search(problem, beam_width=100, max_expansions=100000, use_cost=True):
+    """
+    Breadth-first search that keeps only the ``beam_width`` best nodes of
+    each layer, ranked by g + h (or by h alone with ``use_cost=False``).
+
+    Memory is bounded by one layer of successors; states of the previous
+    layer are remembered so the beam does not step straight back. Beam
+    search is incomplete: if the beam empties or ``max_expansions`` nodes
+    have been expanded, the closest node seen (BoundedNode.closer_than) is
+    returned with ``solved=False``.
+    """
+    start = time.perf_counter()
+    root = root_node(problem)
+    closest = root
+    expanded = generated = 0
+    peak = 1
+
+    def result(node, solved, stopped):
+        return BoundedResult(node, solved, stopped, expanded, generated, 0, peak,
+                             time.perf_counter() - start)
+
+    if problem.is_goal(root.state):
+        return result(root, True, 'goal')
+
+    beam, previous = [root], set()
+    while beam:
+        layer = {}
+        current = {node.state for node in beam}
+        for node in beam:
+            if expanded >= max_expansions:
+                return result(closest, False, 'expansions')
+            expanded += 1
+            for action in problem.actions(node.state):
+                child = node.child(action)
+                generated += 1
+                if child.state in previous or child.state in current:
+                    continue
+                if problem.is_goal(child.state):
+                    return result(child, True, 'goal')
+                if child.h == float('inf'):
+                    continue
+                child.f = child.cost + child.h if use_cost else child.h
+                if child.closer_than(closest):
+                    closest = child
+                known = layer.get(child.state)
+                if known is None or child.f < known.f:
+                    layer[child.state] = child
+        peak = max(peak, len(layer))
+        previous = current
+        beam = heapq.nsmallest(beam_width, layer.values(), key=lambda node: node.f)
+
+    return result(closest, False, 'exhausted')
@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+from simpleai.search.models import SearchNode
+
+# node: the goal node, or the node closest to the goal when solved is False
+# stopped: 'goal', 'exhausted', 'memory' (no solution fits in the node budget)
+#          or 'expansions' (expansion budget used up)
+BoundedResult = namedtuple('BoundedResult',
+                           'node solved stopped expanded generated forgotten peak_nodes elapsed')
+
+
+class BoundedNode(SearchNode):
+    """
+    A simpleai ``SearchNode`` (so ``path()``, ``cost`` and ``depth`` work as
+    usual) with the bookkeeping the bounded searches need.
+    """
+
+    def __init__(self, state, parent=None, action=None, cost=0, problem=None, depth=0):
+        super().__init__(state, parent, action, cost, problem, depth)
+        self.h = 0
+        self.f = 0
+        self.progress = 0                # problem.progress(state), if the problem has one
+        self.children = []               # successors currently held in memory
+        self.forgotten_f = float('inf')  # best f among forgotten successors
+        self.open = False
+        self.version = 0
+
+    def child(self, action):
+        problem = self.problem
+        state = problem.result(self.state, action)
+        node = BoundedNode(state, self, action,
+                           self.cost + problem.cost(self.state, action, state),
+                           problem, self.depth + 1)
+        _score(node)
+        return node
+
+    def closer_than(self, other):
+        """
+        The better partial answer when a budget runs out: more progress, then
+        lower heuristic, then deeper. A problem whose heuristic says little
+        about partial states (it may not drop until the goal) defines
+        ``progress(state)``, higher meaning closer to a solution.
+        """
+        return (-self.progress, self.h, -self.depth) < (-other.progress, other.h, -other.depth)
+
+
+def _score(node):
+    problem = node.problem
+    node.h = problem.heuristic(node.state)
+    if hasattr(problem, 'progress'):
+        node.progress = problem.progress(node.state)
+
+
+def root_node(problem):
+    node = BoundedNode(problem.initial_state, problem=problem)
+    _score(node)
+    node.f = node.h
+    return node
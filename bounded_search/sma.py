@@ -0,0 +1,152 @@
+import heapq
+import itertools
+import time
+
+from .nodes import BoundedResult, root_node
+
+INF = float('inf')
+
+# Stale heap entries keep forgotten nodes (and their parent chains) alive, so
+# both heaps are rebuilt once they hold this many entries per node in the tree
+COMPACT_FACTOR = 4
+
+
+def sma_star(problem, max_nodes=10000, max_expansions=100000):
+    """
+    Simplified memory-bounded A* (SMA*).
+
+    Behaves like A* until ``max_nodes`` nodes are held, then forgets the
+    worst leaf (highest f, shallowest first) and backs its f value up into
+    the parent, which is re-expanded only once every other path looks worse.
+    A node is expanded all at once, so the tree may exceed ``max_nodes`` by
+    at most one branching factor before it is pruned back.
+
+    The result is optimal if the shallowest optimal solution fits in memory
+    (its depth is below ``max_nodes``). Otherwise, or once ``max_expansions``
+    nodes have been expanded, the closest node seen (BoundedNode.closer_than) is
+    returned with ``solved=False``.
+
+    ``peak_nodes`` counts heap entries as well as tree nodes, since a stale
+    entry keeps its node in memory until the heaps are compacted.
+    """
+    start = time.perf_counter()
+    root = root_node(problem)
+    counter = itertools.count()
+    best_heap, worst_heap = [], []
+    stats = {'expanded': 0, 'generated': 1, 'forgotten': 0, 'used': 1, 'peak': 1}
+    closest = root
+    cutoff = False
+
+    def push(node):
+        """(Re)insert an open node: a leaf keyed by f, a partly forgotten node by forgotten_f"""
+        node.open = True
+        node.version += 1
+        if node.children:
+            heapq.heappush(best_heap, (node.forgotten_f, -node.depth, next(counter), node.version, node))
+        else:
+            heapq.heappush(best_heap, (node.f, -node.depth, next(counter), node.version, node))
+            heapq.heappush(worst_heap, (-node.f, node.depth, next(counter), node.version, node))
+        stats['peak'] = max(stats['peak'], len(best_heap) + len(worst_heap))
+
+    def compact():
+        """Drop stale entries once they outnumber the live ones by COMPACT_FACTOR"""
+        if len(best_heap) + len(worst_heap) <= COMPACT_FACTOR * max(stats['used'], max_nodes):
+            return
+        best_heap[:] = [entry for entry in best_heap if entry[4].open and entry[3] == entry[4].version]
+        worst_heap[:] = [entry for entry in worst_heap
+                         if entry[4].open and entry[3] == entry[4].version and not entry[4].children]
+        heapq.heapify(best_heap)
+        heapq.heapify(worst_heap)
+
+    def pop_best():
+        while best_heap:
+            key, _, _, version, node = heapq.heappop(best_heap)
+            if node.open and version == node.version:
+                return key, node
+        return INF, None
+
+    def pop_worst_leaf():
+        while worst_heap:
+            _, _, _, version, node = heapq.heappop(worst_heap)
+            if node.open and version == node.version and not node.children and node is not root:
+                return node
+        return None
+
+    def backup(node):
+        """Propagate a changed f value from the children of node up to the root"""
+        while node is not None and node.children:
+            f = min(min(child.f for child in node.children), node.forgotten_f)
+            if f == node.f:
+                break
+            node.f = f
+            node = node.parent
+
+    def result(node, solved, stopped):
+        return BoundedResult(node, solved, stopped, stats['expanded'], stats['generated'],
+                             stats['forgotten'], stats['peak'], time.perf_counter() - start)
+
+    push(root)
+    while True:
+        key, node = pop_best()
+        if node is None or key == INF:
+            return result(closest, False, 'memory' if cutoff else 'exhausted')
+        if problem.is_goal(node.state):
+            return result(node, True, 'goal')
+        if max_expansions is not None and stats['expanded'] >= max_expansions:
+            return result(closest, False, 'expansions')
+
+        # Expand: (re)generate every successor not held in memory, skipping cycles
+        node.open = False
+        stats['expanded'] += 1
+        in_memory = {child.action for child in node.children}
+        ancestors = set()
+        ancestor = node.parent
+        while ancestor is not None:
+            ancestors.add(ancestor.state)
+            ancestor = ancestor.parent
+        new_children = []
+        for action in problem.actions(node.state):
+            if action in in_memory:
+                continue
+            child = node.child(action)
+            if child.state in ancestors:
+                continue
+            if child.depth >= max_nodes - 1 and not problem.is_goal(child.state):
+                child.f = INF  # a path this long cannot be extended within the budget
+                cutoff = True
+            else:
+                child.f = max(node.f, child.cost + child.h)  # pathmax keeps f monotone
+            if child.closer_than(closest):
+                closest = child
+            new_children.append(child)
+        node.forgotten_f = INF
+        stats['generated'] += len(new_children)
+        stats['used'] += len(new_children)
+        stats['peak'] = max(stats['peak'], stats['used'])
+
+        if new_children:
+            node.children.extend(new_children)
+            for child in new_children:
+                push(child)
+            backup(node)
+        elif not node.children:
+            node.f = INF  # dead end
+            push(node)
+            backup(node.parent)
+
+        # Forget the worst leaves until the tree fits in the budget again
+        while stats['used'] > max_nodes:
+            worst = pop_worst_leaf()
+            if worst is None:
+                break
+            worst.open = False
+            parent = worst.parent
+            parent.children.remove(worst)
+            parent.forgotten_f = min(parent.forgotten_f, worst.f)
+            stats['used'] -= 1
+            stats['forgotten'] += 1
+            if not parent.children:
+                parent.f = parent.forgotten_f
+            push(parent)
+            backup(parent.parent)
+        compact()
@@ -0,0 +1,43 @@
+"""
+Every project has its own flat ``main.py`` (and siblings imported by bare
+name), so tests from two projects cannot share ``sys.modules``. Before a
+project's tests are collected or run, its directory goes first on
+``sys.path`` and modules loaded from the other projects are parked until
+their own tests run again.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PROJECTS = ('Bai1', 'Bai2', 'Bai3', 'Bai4')
+
+
+_parked = {project: {} for project in PROJECTS}
+
+
+def _activate(path):
+    project = os.path.relpath(str(path), ROOT).split(os.sep)[0]
+    if project not in PROJECTS:
+        return
+    directory = os.path.join(ROOT, project)
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, '__file__', None) or ''
+        owner = os.path.relpath(filename, ROOT).split(os.sep)[0] if filename else None
+        if owner in PROJECTS and owner != project:
+            _parked[owner][name] = sys.modules.pop(name)
+    # Bring back this project's modules so objects the tests hold (and pickle) stay current
+    sys.modules.update(_parked[project])
+    _parked[project].clear()
+    others = [os.path.join(ROOT, name) for name in PROJECTS if name != project]
+    sys.path[:] = [entry for entry in sys.path if entry not in others and entry != directory]
+    sys.path.insert(0, directory)
+
+
+def pytest_collectstart(collector):
+    if getattr(collector, 'path', None) is not None and collector.path.is_file():
+        _activate(collector.path)
+
+
+def pytest_runtest_setup(item):
+    _activate(item.path)